@@ -4,18 +4,27 @@ Modern multi-page Streamlit application with dynamic LLM detection, visual compa
 """
 
 import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+import io
 import os
 import sys
 from pathlib import Path
-import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Optional, Tuple
 import difflib
+import html
 import re
 
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # fall back to difflib's pure-Python matcher
+    Levenshtein = None
+
 # Configure page
 st.set_page_config(
     page_title="ATS CV Optimizer",
@@ -31,137 +40,22 @@ try:
     from ats_app.cv_optimizer_enhanced import IntelligentCVOptimizer
     from ats_app.cv_enhancer import CVEnhancer, OptimizationWorkflow
     from ats_app.industry_standards import CVIndustryStandards
-    from ats_app.utils import setup_logger
+    from ats_app.utils import setup_logger, read_docx_text, json_loads, json_dumps
 except ImportError:
     st.error("❌ ATS app modules not found. Please ensure all files are in the correct directory structure.")
     st.stop()
 
 # Custom CSS
-def load_css():
-    """Load custom CSS styling"""
-    css = """
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    :root {
-        --primary-color: #2E86AB;
-        --primary-light: #A8DADC;
-        --primary-dark: #1D5F7E;
-        --secondary-color: #F1FAEE;
-        --accent-color: #E63946;
-        --success-color: #06D6A0;
-        --warning-color: #FFD23F;
-        --info-color: #118AB2;
-        --bg-primary: #FFFFFF;
-        --bg-secondary: #F8F9FA;
-        --text-primary: #212529;
-        --text-secondary: #6C757D;
-        --border-color: #DEE2E6;
-        --shadow: rgba(0, 0, 0, 0.1);
-        --radius: 0.75rem;
-    }
-
-    .main .block-container {
-        padding-top: 2rem !important;
-        padding-bottom: 3rem !important;
-        max-width: 1200px !important;
-    }
-    
-    .stApp {
-        font-family: 'Inter', sans-serif !important;
-    }
-
-    .page-header {
-        background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: var(--radius);
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 10px 25px var(--shadow);
-    }
-
-    .page-header h1 {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-    }
-
-    .metric-card {
-        background: var(--bg-secondary);
-        border: 1px solid var(--border-color);
-        border-radius: var(--radius);
-        padding: 1.5rem;
-        text-align: center;
-        transition: all 0.3s ease;
-        margin-bottom: 1rem;
-    }
-
-    .metric-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 20px var(--shadow);
-    }
-
-    .metric-number {
-        font-size: 2rem;
-        font-weight: 700;
-        color: var(--primary-color);
-        margin-bottom: 0.5rem;
-        display: block;
-    }
-
-    .status-badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        border-radius: 50px;
-        font-size: 0.8rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-
-    .status-success {
-        background-color: var(--success-color);
-        color: white;
-    }
-
-    .comparison-container {
-        display: grid;
-        grid-template-columns: 1fr 1fr;
-        gap: 1rem;
-        margin: 1rem 0;
-    }
+CSS_PATH = Path(__file__).parent / "assets" / "style.css"
 
-    .comparison-side {
-        background: var(--bg-secondary);
-        border: 2px solid var(--border-color);
-        border-radius: var(--radius);
-        padding: 1rem;
-    }
-
-    .comparison-side.before {
-        border-color: var(--accent-color);
-    }
-
-    .comparison-side.after {
-        border-color: var(--success-color);
-    }
-
-    .highlight-add {
-        background-color: rgba(6, 214, 160, 0.2);
-        padding: 2px 4px;
-        border-radius: 4px;
-    }
+@st.cache_data(show_spinner=False)
+def _css() -> str:
+    """Read the stylesheet once per process"""
+    return CSS_PATH.read_text(encoding="utf-8")
 
-    .highlight-remove {
-        background-color: rgba(230, 57, 70, 0.2);
-        padding: 2px 4px;
-        border-radius: 4px;
-        text-decoration: line-through;
-    }
-    </style>
-    """
-    st.markdown(css, unsafe_allow_html=True)
+def load_css():
+    """Load custom CSS styling"""
+    st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 # Navigation
 def create_navigation():
@@ -187,11 +81,24 @@ def create_navigation():
     return st.session_state.current_page
 
 # Ollama Model Detection
+# (connect, read) - a stopped Ollama fails the connect almost instantly, so
+# keep both short to avoid stalling page renders.
+OLLAMA_PROBE_TIMEOUT = (0.5, 2.0)
+
+@st.cache_resource(show_spinner=False)
+def _http() -> requests.Session:
+    """Process-wide HTTP session so Ollama probes reuse keep-alive connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 @st.cache_data(ttl=300)
 def get_available_models() -> List[str]:
     """Dynamically fetch available Ollama models"""
     try:
-        response = requests.get("http://localhost:11434/api/tags", timeout=5)
+        response = _http().get("http://localhost:11434/api/tags", timeout=OLLAMA_PROBE_TIMEOUT)
         if response.status_code == 200:
             models_data = response.json()
             return [model["name"] for model in models_data.get("models", [])]
@@ -202,84 +109,206 @@ def get_available_models() -> List[str]:
         st.warning("⚠️ Ollama not available. Using fallback models.")
         return ["deepseek-r1:8b"]
 
+@st.cache_resource(show_spinner=False)
+def get_optimizer(ollama_url: str, model: str) -> IntelligentCVOptimizer:
+    """Shared optimizer instance per (url, model), reused across reruns"""
+    return IntelligentCVOptimizer(ollama_url=ollama_url, model=model)
+
+@st.cache_data(ttl=30, show_spinner=False)
 def test_ollama_connection(url: str, model: str) -> Tuple[bool, str]:
-    """Test connection to Ollama"""
+    """Test connection to Ollama (result reused for 30s per url/model)"""
     try:
-        optimizer = IntelligentCVOptimizer(ollama_url=url, model=model)
+        optimizer = get_optimizer(url, model)
         result = optimizer.test_ollama_connection()
         return result["success"], result.get("message", "Connection test completed")
     except Exception as e:
         return False, f"Connection failed: {str(e)}"
 
-# Data Management
-def get_cv_store() -> Dict:
-    """Get CV management data"""
-    cv_dir = Path("data/cvs")
-    cv_dir.mkdir(exist_ok=True, parents=True)
-    
-    cvs = {}
-    for cv_file in cv_dir.glob("*.json"):
-        try:
-            with open(cv_file, 'r', encoding='utf-8') as f:
-                cv_data = json.load(f)
-                cvs[cv_file.stem] = cv_data
-        except Exception as e:
-            st.error(f"Error loading CV {cv_file}: {e}")
-    
-    return cvs
+class _OptimizationFailed(Exception):
+    """Unsuccessful optimizer result; raised so st.cache_data doesn't persist it"""
 
-def get_jd_store() -> Dict:
-    """Get Job Description store"""
-    jd_dir = Path("data/job_descriptions")
-    jd_dir.mkdir(exist_ok=True, parents=True)
-    
-    jds = {}
-    for jd_file in jd_dir.glob("*.json"):
+# Persisted without a TTL (Streamlit ignores ttl with persist="disk"); max_entries bounds the store
+@st.cache_data(persist="disk", max_entries=64, show_spinner="🔄 Optimizing your CV...")
+def _run_optimize(cv_bytes: bytes, suffix: str, job_description: str,
+                  ollama_url: str, model: str, governance_level: str) -> Dict:
+    """Optimize a CV, reusing the stored result for identical (CV, JD, model, level) inputs"""
+    tmp_cv_path = None
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+            tmp_cv_path = tmp_file.name
+            tmp_file.write(cv_bytes)
+        
+        results = get_optimizer(ollama_url, model).optimize_cv(
+            cv_path=tmp_cv_path,
+            job_description=job_description,
+            governance_level=governance_level
+        )
+    finally:
+        # Clean up even when optimization fails
+        if tmp_cv_path and os.path.exists(tmp_cv_path):
+            os.unlink(tmp_cv_path)
+    
+    if not results["success"]:
+        raise _OptimizationFailed(results.get('message', 'Unknown error'))
+    return results
+
+# Upload Handling
+# Keyed on name and the full content (already in memory), so any edit to a re-uploaded file misses
+@st.cache_data(show_spinner=False, hash_funcs={UploadedFile: lambda f: (f.name, f.getvalue())})
+def extract_uploaded_text(uploaded_file: UploadedFile) -> str:
+    """Extract plain text from an uploaded .txt or .docx file"""
+    uploaded_file.seek(0)
+    if uploaded_file.name.lower().endswith(".docx"):
+        return read_docx_text(uploaded_file)
+    if uploaded_file.type.startswith("text"):
+        # Tolerate BOMs and non-UTF8 bytes (e.g. Word-exported .txt on Windows)
+        wrapper = io.TextIOWrapper(uploaded_file, encoding="utf-8-sig", errors="replace")
         try:
-            with open(jd_file, 'r', encoding='utf-8') as f:
-                jd_data = json.load(f)
-                jds[jd_file.stem] = jd_data
-        except Exception as e:
-            st.error(f"Error loading JD {jd_file}: {e}")
+            return wrapper.read()
+        finally:
+            wrapper.detach()  # don't close the underlying upload buffer
+    st.warning(f"⚠️ Cannot extract text from {uploaded_file.name} - please upload a .txt or .docx file.")
+    return ""
+
+# Change Highlighting
+_DIFF_TOKEN_RE = re.compile(r'(\s+)')
+
+def _diff_opcodes(a: List[str], b: List[str]):
+    """(tag, i1, i2, j1, j2) edit opcodes between two token lists"""
+    if Levenshtein is not None:
+        return [tuple(op) for op in Levenshtein.opcodes(a, b)]
+    return difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_word_diff(original: str, optimized: str) -> str:
+    """HTML word diff with highlight-add / highlight-remove spans"""
+    a = _DIFF_TOKEN_RE.split(original)
+    b = _DIFF_TOKEN_RE.split(optimized)
+    
+    parts = []
+    for tag, i1, i2, j1, j2 in _diff_opcodes(a, b):
+        if tag == "equal":
+            parts.append(html.escape("".join(a[i1:i2])))
+            continue
+        if tag in ("delete", "replace"):
+            parts.append(f'<span class="highlight-remove">{html.escape("".join(a[i1:i2]))}</span>')
+        if tag in ("insert", "replace"):
+            parts.append(f'<span class="highlight-add">{html.escape("".join(b[j1:j2]))}</span>')
+    
+    return f'<div style="white-space: pre-wrap;">{"".join(parts)}</div>'
+
+def render_connection_test(url: str, model: str, spinner_text: str = "Testing connection..."):
+    """Test / force-retest buttons with the result message"""
+    col_test, col_retest = st.columns(2)
+    with col_test:
+        run_test = st.button("🔍 Test Connection")
+    with col_retest:
+        force_retest = st.button("🔄 Force Retest")
+    
+    if force_retest:
+        test_ollama_connection.clear()
+    
+    if run_test or force_retest:
+        with st.spinner(spinner_text):
+            success, message = test_ollama_connection(url, model)
+            if success:
+                st.success(f"✅ {message}")
+            else:
+                st.error(f"❌ {message}")
+
+# Data Management
+DATA_CV_DIR = Path("data/cvs")
+DATA_JD_DIR = Path("data/job_descriptions")
+
+@st.cache_resource(show_spinner=False)
+def _ensure_data_dirs() -> None:
+    """Create the store directories once per process rather than on every rerun"""
+    DATA_CV_DIR.mkdir(parents=True, exist_ok=True)
+    DATA_JD_DIR.mkdir(parents=True, exist_ok=True)
+
+_ensure_data_dirs()
+
+# Characters dropped from JD filenames; spaces then become underscores, as names have always been built
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w \-]')
+_WORD_RE = re.compile(r'\S+')
+
+def _json_entries(directory: Path) -> List[os.DirEntry]:
+    """JSON files in a store directory (DirEntry caches its stat result)"""
+    with os.scandir(directory) as it:
+        return [e for e in it if e.name.endswith(".json") and e.is_file()]
+
+def _dir_signature(directory: Path) -> Tuple:
+    """Cheap fingerprint of the JSON files in a directory (name, mtime, size)"""
+    return tuple(sorted(
+        (e.name, stat.st_mtime_ns, stat.st_size)
+        for e in _json_entries(directory)
+        for stat in (e.stat(),)
+    ))
+
+def _read_json_file(entry: os.DirEntry) -> Tuple[str, Optional[Dict], Optional[Exception]]:
+    """Parse one store file, returning the error instead of raising it"""
+    try:
+        with open(entry.path, 'rb') as f:
+            return entry.name[:-5], json_loads(f.read()), None
+    except Exception as e:
+        return entry.name[:-5], None, e
+
+def _load_json_dir(directory: Path, label: str) -> Dict:
+    """Parse every JSON file in a store directory, overlapping the file reads"""
+    entries = _json_entries(directory)
+    if not entries:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        loaded = list(executor.map(_read_json_file, entries))
+    
+    # Report errors from the script thread; worker threads have no Streamlit context
+    store = {}
+    for entry, (stem, data, error) in zip(entries, loaded):
+        if error is not None:
+            st.error(f"Error loading {label} {entry.path}: {error}")
+        else:
+            store[stem] = data
     
-    return jds
+    return store
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_cv_store(signature: Tuple) -> Dict:
+    """Get CV management data (cached until the directory signature changes)"""
+    return _load_json_dir(DATA_CV_DIR, "CV")
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_jd_store(signature: Tuple) -> Dict:
+    """Get Job Description store (cached until the directory signature changes)"""
+    return _load_json_dir(DATA_JD_DIR, "JD")
 
 def save_job_description(title: str, content: str, company: str = "", url: str = ""):
     """Save job description with enhanced metadata"""
-    jd_dir = Path("data/job_descriptions")
-    jd_dir.mkdir(exist_ok=True, parents=True)
-    
     jd_data = {
         "title": title,
         "company": company,
         "content": content,
         "url": url,
         "saved_at": datetime.now().isoformat(),
-        "word_count": len(content.split()),
+        "word_count": sum(1 for _ in _WORD_RE.finditer(content)),
         "char_count": len(content)
     }
     
-    safe_filename = "".join(c for c in f"{company}_{title}" if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_')
+    safe_filename = _UNSAFE_FILENAME_RE.sub('', f"{company}_{title}").strip().replace(' ', '_')
     
-    jd_path = jd_dir / f"{safe_filename}.json"
-    with open(jd_path, 'w', encoding='utf-8') as f:
-        json.dump(jd_data, f, indent=2, ensure_ascii=False)
+    # Write to a sibling temp file and rename so a crash never leaves a truncated JD
+    jd_path = DATA_JD_DIR / f"{safe_filename}.json"
+    tmp_path = jd_path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(json_dumps(jd_data))
+    os.replace(tmp_path, jd_path)
     
     return True
 
 # Page Functions
-def home_page():
-    """Home page with dashboard"""
-    st.markdown("""
-    <div class="page-header fade-in">
-        <h1>🚀 ATS CV Optimizer</h1>
-        <p>AI-Powered CV optimization with strict industry governance and visual feedback</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Quick Stats
-    cvs = get_cv_store()
-    jds = get_jd_store()
+def _quick_stats():
+    """Dashboard metric cards"""
+    cvs = get_cv_store(_dir_signature(DATA_CV_DIR))
+    jds = get_jd_store(_dir_signature(DATA_JD_DIR))
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -316,6 +345,18 @@ def home_page():
         </div>
         """, unsafe_allow_html=True)
 
+def home_page():
+    """Home page with dashboard"""
+    st.markdown("""
+    <div class="page-header fade-in">
+        <h1>🚀 ATS CV Optimizer</h1>
+        <p>AI-Powered CV optimization with strict industry governance and visual feedback</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Quick Stats
+    _quick_stats()
+
     # Quick Actions
     st.markdown("### ⚡ Quick Actions")
     col1, col2, col3 = st.columns(3)
@@ -335,43 +376,59 @@ def home_page():
             st.session_state.current_page = "cv_management"
             st.rerun()
 
-def cv_optimizer_page():
-    """Enhanced CV optimization page with visual comparisons"""
-    st.markdown("""
-    <div class="page-header">
-        <h1>📄 CV Optimizer</h1>
-        <p>AI-powered optimization with before/after comparisons and change approval</p>
-    </div>
-    """, unsafe_allow_html=True)
+@st.fragment
+def _llm_config_panel():
+    """LLM settings; editing them reruns only this panel, not the whole page.
     
-    # Configuration Section
+    Fragment reruns discard return values, so the chosen settings are published through
+    session state (``llm_ollama_url`` and ``llm_model``) for the rest of the page to read.
+    """
     with st.expander("⚙️ LLM Configuration", expanded=False):
         col1, col2 = st.columns(2)
         
         with col1:
-            ollama_url = st.text_input("Ollama Server URL", value="http://localhost:11434")
+            ollama_url = st.text_input("Ollama Server URL", value="http://localhost:11434", key="llm_ollama_url")
         
         with col2:
             available_models = get_available_models()
             if available_models:
-                model_name = st.selectbox("LLM Model", options=available_models)
+                model_name = st.selectbox("LLM Model", options=available_models, key="llm_model")
             else:
                 st.error("❌ No Ollama models available")
+                # Don't leave a previously chosen model behind for the page to use
+                st.session_state.pop("llm_model", None)
                 return
         
         # Test Connection
-        if st.button("🔍 Test Connection"):
-            with st.spinner("Testing connection..."):
-                success, message = test_ollama_connection(ollama_url, model_name)
-                if success:
-                    st.success(f"✅ {message}")
-                else:
-                    st.error(f"❌ {message}")
+        render_connection_test(ollama_url, model_name)
+
+def cv_optimizer_page():
+    """Enhanced CV optimization page with visual comparisons"""
+    st.markdown("""
+    <div class="page-header">
+        <h1>📄 CV Optimizer</h1>
+        <p>AI-powered optimization with before/after comparisons and change approval</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Configuration Section
+    _llm_config_panel()
+    ollama_url = st.session_state.get("llm_ollama_url", "http://localhost:11434")
+    model_name = st.session_state.get("llm_model")
+    if model_name is None:
+        return
     
     # CV Upload Section
     st.markdown("### 📎 Upload CV")
     cv_file = st.file_uploader("Choose your CV file", type=['docx', 'pdf', 'txt'])
     
+    # Parse as soon as the upload lands so the text is cached before Optimize is clicked
+    cv_text = ""
+    if cv_file and cv_file.name.lower().endswith(('.docx', '.txt')):
+        cv_text = extract_uploaded_text(cv_file)
+        if cv_text:
+            st.caption(f"📝 {sum(1 for _ in _WORD_RE.finditer(cv_text))} words extracted from {cv_file.name}")
+    
     # Job Description Section
     st.markdown("### 📋 Job Description")
     jd_tab1, jd_tab2, jd_tab3 = st.tabs(["📝 Paste", "📄 Upload", "🗄️ Saved"])
@@ -399,10 +456,10 @@ def cv_optimizer_page():
     with jd_tab2:
         jd_file = st.file_uploader("Choose job description file", type=['txt', 'pdf', 'docx'])
         if jd_file:
-            jd_content = jd_file.read().decode('utf-8') if jd_file.type.startswith('text') else "File uploaded - processing needed"
+            jd_content = extract_uploaded_text(jd_file)
     
     with jd_tab3:
-        saved_jds = get_jd_store()
+        saved_jds = get_jd_store(_dir_signature(DATA_JD_DIR))
         if saved_jds:
             selected_jd = st.selectbox("Select saved job description:", list(saved_jds.keys()))
             if selected_jd:
@@ -415,53 +472,46 @@ def cv_optimizer_page():
     # Process Button
     if st.button("🚀 Optimize CV", type="primary", disabled=not (cv_file and jd_content)):
         if cv_file and jd_content:
-            with st.spinner("🔄 Optimizing your CV..."):
-                try:
-                    # Save uploaded CV temporarily
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{cv_file.name.split('.')[-1]}") as tmp_file:
-                        tmp_file.write(cv_file.read())
-                        tmp_cv_path = tmp_file.name
-                    
-                    # Initialize optimizer
-                    optimizer = IntelligentCVOptimizer(ollama_url=ollama_url, model=model_name)
-                    
-                    # Process CV
-                    results = optimizer.optimize_cv(
-                        cv_path=tmp_cv_path,
-                        job_description=jd_content,
-                        governance_level="comprehensive"
-                    )
-                    
-                    if results["success"]:
-                        st.success("✅ CV optimization completed!")
-                        
-                        # Show basic comparison
-                        original_content = results.get('original_content', '')
-                        optimized_content = results.get('optimized_content', '')
-                        
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.markdown("**📄 Original CV**")
-                            st.text_area("", value=original_content[:500] + "...", height=300, disabled=True)
-                        
-                        with col2:
-                            st.markdown("**✨ Optimized CV**")
-                            st.text_area("", value=optimized_content[:500] + "...", height=300, disabled=True)
-                        
-                        # Show report if available
-                        if 'report' in results:
-                            st.markdown("### 📊 Optimization Report")
-                            st.markdown(results['report'])
-                    
-                    else:
-                        st.error(f"❌ Optimization failed: {results.get('message', 'Unknown error')}")
-                    
-                    # Clean up
-                    os.unlink(tmp_cv_path)
-                    
-                except Exception as e:
-                    st.error(f"❌ Error during optimization: {str(e)}")
+            try:
+                results = _run_optimize(
+                    cv_file.getvalue(),
+                    f".{cv_file.name.split('.')[-1]}",
+                    jd_content,
+                    ollama_url,
+                    model_name,
+                    "comprehensive"
+                )
+                
+                st.success("✅ CV optimization completed!")
+                
+                # Show basic comparison
+                original_content = results.get('original_content') or cv_text
+                optimized_content = results.get('optimized_content', '')
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**📄 Original CV**")
+                    st.text_area("", value=original_content[:500] + "...", height=300, disabled=True)
+                
+                with col2:
+                    st.markdown("**✨ Optimized CV**")
+                    st.text_area("", value=optimized_content[:500] + "...", height=300, disabled=True)
+                
+                if original_content and optimized_content:
+                    with st.expander("🔍 Highlighted Changes"):
+                        st.markdown(render_word_diff(original_content, optimized_content),
+                                    unsafe_allow_html=True)
+                
+                # Show report if available
+                if 'report' in results:
+                    st.markdown("### 📊 Optimization Report")
+                    st.markdown(results['report'])
+            
+            except _OptimizationFailed as e:
+                st.error(f"❌ Optimization failed: {e}")
+            except Exception as e:
+                st.error(f"❌ Error during optimization: {str(e)}")
 
 def job_descriptions_page():
     """Job Descriptions management page"""
@@ -515,13 +565,7 @@ def settings_page():
     
     with col2:
         st.markdown("**Connection Status**")
-        if st.button("🔍 Test Connection"):
-            with st.spinner("Testing..."):
-                success, message = test_ollama_connection(ollama_url, available_models[0] if available_models else "")
-                if success:
-                    st.success(f"✅ {message}")
-                else:
-                    st.error(f"❌ {message}")
+        render_connection_test(ollama_url, available_models[0] if available_models else "", "Testing...")
 
 # Main App
 def main():
@@ -1,6 +1,14 @@
+import copy
+import re
+from functools import lru_cache
 from pathlib import Path
 import yaml
 
+try:  # libyaml C parser when available, same output as the pure-Python one
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 DEFAULT_CONFIG = {
     "logging": {
         "level": "INFO",
@@ -28,15 +36,65 @@ DEFAULT_CONFIG = {
     }
 }
 
+def _trie_regex(node):
+    """Regex for a keyword trie; a shared prefix is matched once instead of once per keyword"""
+    branches = [re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # Greedy optional tail: the longer keyword is tried first, as in a longest-first alternation
+    return "(?:" + body + ")?" if "" in node else body
+
+def _keyword_pattern(keywords):
+    """One prefix-factored pattern for a keyword list; phrases win over their prefixes"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    if not trie:
+        return re.compile(r"(?!)")  # never matches
+    return re.compile(r"\b(" + _trie_regex(trie) + r")\b", re.IGNORECASE)
+
+def _compile_patterns(cfg):
+    """Attach compiled regexes to the config so scans never recompile them.
+
+    ``hard_re``/``soft_re`` match every keyword in a single pass:
+    ``Counter(m.lower() for m in cfg["ats"]["hard_re"].findall(text))``.
+    """
+    ats = cfg["ats"]
+    for rf in ats.get("red_flags", []):
+        rf["compiled"] = re.compile(rf["pattern"], re.IGNORECASE)
+    ats["hard_re"] = _keyword_pattern(ats.get("hard_keywords", []))
+    ats["soft_re"] = _keyword_pattern(ats.get("soft_keywords", []))
+    return cfg
+
+_compile_patterns(DEFAULT_CONFIG)
+
+def _deep_merge(base, override):
+    """Recursively merge ``override`` into ``base`` (in place) and return it"""
+    for k, v in override.items():
+        if isinstance(v, dict) and isinstance(base.get(k), dict):
+            base[k] = _deep_merge(base[k], v)
+        else:
+            base[k] = v
+    return base
+
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int):
+    """Parse a YAML file once per (path, mtime); edits invalidate the entry"""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_Loader) or {}
+
 def load_config(path: str | None):
     if not path:
         return DEFAULT_CONFIG
     p = Path(path)
     if not p.exists():
         return DEFAULT_CONFIG
-    with p.open("r", encoding="utf-8") as f:
-        user_cfg = yaml.safe_load(f) or {}
-    # merge shallow
-    cfg = DEFAULT_CONFIG.copy()
-    cfg.update(user_cfg)
-    return cfg
\ No newline at end of file
+    user_cfg = _read_yaml(str(p), p.stat().st_mtime_ns)
+    # merge deep, copying so neither the defaults nor the cached YAML are mutated
+    cfg = copy.deepcopy(DEFAULT_CONFIG)
+    _deep_merge(cfg, copy.deepcopy(user_cfg))
+    return _compile_patterns(cfg)
\ No newline at end of file
@@ -1,25 +1,425 @@
 """CV Optimizer - Main optimization engine"""
 
+import asyncio
+import bisect
+import hashlib
 import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable, BinaryIO
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .industry_standards import IndustryStandards
+from .llm_pool import LLMEndpointPool
+from .utils import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Section headings, one named group per section; matched in a single pass over the CV
+_SECTION_RE = re.compile(
+    r'(?P<summary>summary|profile|objective)'
+    r'|(?P<experience>experience|work|employment|career)'
+    r'|(?P<education>education)'
+    r'|(?P<skills>skills)'
+    r'|(?P<certifications>certifications|certificates)'
+    r'|(?P<projects>projects)',
+    re.IGNORECASE
+)
+_SECTION_NAMES = ('summary', 'experience', 'education', 'skills', 'certifications', 'projects')
+
+_BULLET_RE = re.compile(r'\s*[•\-*]')
+_QUANT_RE = re.compile(r'[%$0-9]')
+
+POWER_VERBS = ('architected', 'orchestrated', 'spearheaded', 'optimized', 'transformed')
+_POWER_VERB_RE = re.compile(r'\b(?:' + '|'.join(POWER_VERBS) + r')\b')  # applied to lowercased lines
+TECH_SKILLS = ('python', 'java', 'javascript', 'docker', 'kubernetes', 'aws', 'azure', 'devops')
+CULTURE_KEYWORDS = ('collaborative', 'innovative', 'agile', 'fast-paced', 'team-oriented', 'entrepreneurial')
+# Lowercase word tokens; inner '.', '-', '+' and '#' are kept (node.js, fast-paced, c++, c#)
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*')
+_TOKEN_SPLIT_RE = re.compile(r'[.\-]')
+
+def _tokens(text: str) -> frozenset:
+    """Distinct lowercase word tokens of ``text``, plus the parts of compound ones (docker-compose -> docker, compose)"""
+    tokens = set(_TOKEN_RE.findall(text.lower()))
+    for token in [token for token in tokens if '.' in token or '-' in token]:
+        tokens.update(part for part in _TOKEN_SPLIT_RE.split(token) if part)
+    return frozenset(tokens)
+
+RESPONSIBILITY_INDICATORS = ('responsible for', 'will', 'you will')
+VERB_REPLACEMENTS = MappingProxyType({
+    'worked on': 'developed',
+    'helped with': 'contributed to',
+    'was responsible for': 'managed',
+    'assisted': 'supported'
+})
+
+# Read-only so the shared per-level tables can't be mutated through an optimization context
+OPTIMIZATION_GUIDELINES = MappingProxyType({
+    'conservative': MappingProxyType({
+        'max_changes_per_section': 2,
+        'preserve_structure': True,
+        'focus_areas': ('quantification', 'action_verbs'),
+        'risk_level': 'low'
+    }),
+    'balanced': MappingProxyType({
+        'max_changes_per_section': 4,
+        'preserve_structure': True,
+        'focus_areas': ('quantification', 'action_verbs', 'keywords', 'impact'),
+        'risk_level': 'medium'
+    }),
+    'aggressive': MappingProxyType({
+        'max_changes_per_section': 6,
+        'preserve_structure': False,
+        'focus_areas': ('complete_rewrite', 'quantification', 'action_verbs', 'keywords', 'impact', 'structure'),
+        'risk_level': 'high'
+    })
+})
+_VERB_RE = re.compile(
+    '|'.join(re.escape(weak) for weak in sorted(VERB_REPLACEMENTS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+def _stronger_verb(match: re.Match) -> str:
+    """Replacement for a weak verb match, capitalised if the original was"""
+    strong = VERB_REPLACEMENTS[match.group(0).lower()]
+    return strong[0].upper() + strong[1:] if match.group(0)[0].isupper() else strong
+
+# Characters that matter when tracking JSON object nesting in streamed text
+_JSON_SYNTAX_RE = re.compile(r'[{}"\\]')
+
+class _JSONObjectScanner:
+    """Finds the first complete top-level JSON object with the required keys in streamed text"""
+    
+    def __init__(self, required_keys: Tuple[str, ...]):
+        self.required_keys = required_keys
+        self._chunks: List[str] = []
+        self._length = 0
+        self._depth = 0
+        self._start = 0
+        self._in_string = False
+        self._escaped_pos = -1
+    
+    def feed(self, chunk: str) -> Optional[str]:
+        """Consume a chunk; return the object's JSON text once it is complete"""
+        base = self._length
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        
+        for match in _JSON_SYNTAX_RE.finditer(chunk):
+            pos = base + match.start()
+            if pos == self._escaped_pos:
+                continue
+            ch = match.group()
+            
+            if self._depth == 0:
+                # Prose (or a <think> block) outside any object; wait for an opening brace
+                if ch == '{':
+                    self._depth = 1
+                    self._start = pos
+            elif self._in_string:
+                if ch == '\\':
+                    self._escaped_pos = pos + 1
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    candidate = self.text()[self._start:pos + 1]
+                    try:
+                        obj = json.loads(candidate)
+                    except ValueError:
+                        continue
+                    if isinstance(obj, dict) and all(key in obj for key in self.required_keys):
+                        return candidate
+        
+        return None
+    
+    def text(self) -> str:
+        """Everything received so far"""
+        if len(self._chunks) > 1:
+            self._chunks = [''.join(self._chunks)]
+        return self._chunks[0] if self._chunks else ''
+
+# Ollama serves OLLAMA_NUM_PARALLEL requests at once (4 by default); more only queue
+DEFAULT_CONCURRENCY = 4
+
+# Tokens reserved for the model's answer; the prompt gets the rest of max_context
+GENERATION_TOKENS = 4000
+DEFAULT_MAX_CONTEXT = 8192  # sent to Ollama as num_ctx so the server window matches the budget
+MIN_JD_CHARS = 500  # below this a JD excerpt is useless and the CV alone is over budget
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English prose)"""
+    return len(text) // 4
+
+def _excerpt(text: str, max_chars: int) -> str:
+    """Head and tail of ``text`` within ``max_chars``, marking the cut"""
+    marker = "\n[...]\n"
+    keep = max(max_chars - len(marker), 0)
+    head = keep * 2 // 3
+    return text[:head] + marker + text[len(text) - (keep - head):]
+
+# Word-count bucket edges for batch optimization
+LENGTH_BUCKETS = (512, 1024, 2048, 4096)
+
+def _length_buckets(items: Iterable[Tuple[int, str]],
+                    bins: Tuple[int, ...] = LENGTH_BUCKETS) -> List[List[Tuple[int, str]]]:
+    """Group (index, text) pairs by word count, shortest bucket first"""
+    buckets: List[List[Tuple[int, str]]] = [[] for _ in range(len(bins) + 1)]
+    for idx, cv_text in items:
+        buckets[bisect.bisect_left(bins, len(cv_text.split()))].append((idx, cv_text))
+    return [bucket for bucket in buckets if bucket]
+
+def _cv_id(cv_text: str) -> str:
+    """Stable 16-hex-digit id for a CV, used to key batch checkpoints"""
+    return hashlib.blake2b(cv_text.encode('utf-8'), digest_size=8).hexdigest()
+
+def _run_id(job_description: str, optimization_level: str) -> str:
+    """Short id of a batch's settings, so a checkpoint is only resumed for the same JD and level"""
+    settings = json_dumps([job_description, optimization_level], indent=False)
+    return hashlib.blake2b(settings, digest_size=8).hexdigest()
+
+def _read_checkpoint(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Completed rows of a batch checkpoint keyed by id; a torn final line is ignored"""
+    done = {}
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    row = json_loads(line)
+                except ValueError:
+                    continue
+                if isinstance(row, dict) and 'id' in row:
+                    # The id only keys the checkpoint; resumed rows match fresh results
+                    done[row.pop('id')] = row
+    except FileNotFoundError:
+        pass
+    return done
+
+def _open_checkpoint(path: Path) -> BinaryIO:
+    """Open a checkpoint for appending, terminating any line torn by a crash"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    f = open(path, 'a+b')
+    if f.tell():
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b'\n':
+            f.write(b'\n')
+    return f
+
+def _make_prompt_fn(optimization_level: str, guidelines: Dict[str, Any]) -> Callable[[str, Dict[str, Any]], str]:
+    """Build the main prompt body for one optimization level; only the CV and its stats vary per call"""
+    intro = """
+You are an expert CV optimization specialist. Your task is to improve the following CV while maintaining its authenticity and factual accuracy.
+
+CURRENT CV:
+"""
+    analysis_header = f"""
+
+OPTIMIZATION LEVEL: {optimization_level}
+
+CURRENT ANALYSIS:
+- Total bullet points: """
+    standards = f"""
+
+OPTIMIZATION GUIDELINES:
+- Focus on: {', '.join(guidelines['focus_areas'])}
+- Max changes per section: {guidelines['max_changes_per_section']}
+- Risk level: {guidelines['risk_level']}
+
+INDUSTRY STANDARDS TO FOLLOW:
+- Use Tier 1 action verbs: architected, orchestrated, spearheaded, optimized, transformed
+- Quantify 80%+ of achievements with specific numbers, percentages, or dollar amounts
+- Focus on impact and results, not just responsibilities
+- Use ATS-friendly formatting
+"""
+    
+    def prompt_fn(cv_text: str, analysis: Dict[str, Any]) -> str:
+        return ''.join((
+            intro, cv_text, analysis_header,
+            f"{analysis['total_bullets']}\n"
+            f"- Quantified bullets: {analysis['quantified_bullets']} ({analysis['quantification_rate']:.1f}%)\n"
+            f"- Power verbs used: {analysis['power_verb_count']}",
+            standards
+        ))
+    
+    return prompt_fn
+
+_RESPONSE_INSTRUCTIONS = """
+
+Please provide:
+1. An optimized version of the CV
+2. A list of specific improvements made
+3. Reasoning for each major change
+
+Return your response in this JSON format:
+{
+    "optimized_content": "[full optimized CV text]",
+    "improvements": [
+        {
+            "section": "[section name]",
+            "original": "[original text]",
+            "improved": "[improved text]",
+            "reason": "[reason for change]",
+            "impact_score": [1-10 rating]
+        }
+    ],
+    "summary": "[brief summary of optimizations made]"
+}
+"""
+
+LLM_CACHE_DIR = Path('~/.cache/ats_cv/llm').expanduser()
+LLM_CACHE_TTL = 30 * 86400  # seconds
+LLM_CACHE_SWEEP_INTERVAL = 3600  # seconds between sweeps for expired entries
+
+class _ResponseCache:
+    """Content-addressed LLM response cache: in-process LRU in front of one JSON file per key"""
+    
+    def __init__(self, directory: Optional[Path], ttl: float = LLM_CACHE_TTL, max_memory: int = 512):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_memory = max_memory
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+    
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> str:
+        """BLAKE2b of the request payload (model, prompt and options)"""
+        raw = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            response = json_loads(path.read_bytes())['response']
+        except (OSError, ValueError, KeyError):
+            return None
+        
+        self._remember(key, response)
+        return response
+    
+    def set(self, key: str, response: str):
+        self._remember(key, response)
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.json"
+            # Unique temp name per writer, then an atomic rename over the entry
+            tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp_path.write_bytes(json_dumps({'response': response}, indent=False))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write LLM cache entry: {e}")
+        self._sweep()
+    
+    def _sweep(self):
+        """Remove expired entries from disk, at most once per LLM_CACHE_SWEEP_INTERVAL"""
+        now = time.time()
+        with self._lock:
+            if now - self._last_sweep < LLM_CACHE_SWEEP_INTERVAL:
+                return
+            self._last_sweep = now
+        
+        for path in self.directory.glob('*.json'):
+            try:
+                if now - path.stat().st_mtime > self.ttl:
+                    path.unlink()
+            except OSError:
+                continue  # removed by another process, or not ours to remove
+    
+    def _remember(self, key: str, response: str):
+        with self._lock:
+            self._memory[key] = response
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.max_memory:
+                self._memory.popitem(last=False)
+
 class CVOptimizer:
     """Main CV optimization engine with LLM integration"""
     
     def __init__(self, llm_config: Optional[Dict] = None):
         self.industry_standards = IndustryStandards()
+        # Standards are static; read them once and share a read-only view with every context
+        self._standards = MappingProxyType(self.industry_standards.get_all_standards())
         self.llm_config = llm_config or {
             'provider': 'ollama',
             'model': 'deepseek-r1:8b',
             'base_url': 'http://localhost:11434'
         }
+        # Set 'cache_dir' to None to keep responses in memory only
+        cache_dir = self.llm_config.get('cache_dir', LLM_CACHE_DIR)
+        self._response_cache = _ResponseCache(Path(cache_dir).expanduser() if cache_dir else None)
+        # 'endpoints': [{'base_url': ..., 'concurrency': n}, ...] spreads work over several servers
+        self._endpoint_config = self.llm_config.get('endpoints') or [{
+            'base_url': self.llm_config.get('base_url', 'http://localhost:11434'),
+            'concurrency': self.llm_config.get('concurrency', DEFAULT_CONCURRENCY)
+        }]
+        self._http = self._create_session()
+        # 'qps' caps the request rate across the whole batch (None = unlimited)
+        self._endpoints = LLMEndpointPool(self._endpoint_config, self._http, qps=self.llm_config.get('qps'))
+        self.prompt_stats = {'jd_trimmed': 0, 'over_budget': 0}
+        # Prompt builders with each level's guidelines baked in
+        self._prompt_fns = {
+            level: _make_prompt_fn(level, guidelines)
+            for level, guidelines in OPTIMIZATION_GUIDELINES.items()
+        }
+    
+    def _create_session(self) -> requests.Session:
+        """Keep-alive session for the LLM endpoint; throttling and gateway errors are retried with backoff.
+        
+        Ollama speaks HTTP/1.1 only, so each in-flight generation needs its own socket.
+        The pool holds one per concurrent request and blocks extra callers until a
+        socket frees up, instead of opening throwaway connections past the limit.
+        """
+        # Backoff 0.3s doubling (<5s by the last attempt); a 429/503 Retry-After header takes precedence
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=None,  # /api/generate is a POST but safe to repeat
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        max_concurrency = max(e.get('concurrency', 1) for e in self._endpoint_config)
+        adapter = HTTPAdapter(pool_connections=len(self._endpoint_config), pool_maxsize=max_concurrency,
+                              pool_block=True, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def close(self):
+        """Close pooled connections to the LLM endpoint"""
+        self._http.close()
+    
+    def __enter__(self) -> 'CVOptimizer':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def optimize_cv(self, cv_text: str, job_description: str = "", 
                    optimization_level: str = "balanced") -> Dict[str, Any]:
@@ -33,9 +433,10 @@ class CVOptimizer:
             # Generate optimized content
             optimization_result = self._generate_optimizations(context)
             
-            # Validate improvements
+            # Validate improvements (the original CV was already analysed for the prompt)
             validation_result = self._validate_improvements(
-                cv_text, optimization_result['optimized_content']
+                cv_text, optimization_result['optimized_content'],
+                original_analysis=context['current_analysis']
             )
             
             return {
@@ -57,12 +458,66 @@ class CVOptimizer:
                 'timestamp': datetime.now().isoformat()
             }
     
+    async def optimize_cv_batch(self, cv_texts: List[str], job_description: str = "",
+                                optimization_level: str = "balanced",
+                                output_jsonl: Optional[Path] = None,
+                                id_fn: Callable[[str], str] = _cv_id) -> List[Dict[str, Any]]:
+        """Optimize several CVs concurrently; results are returned in input order.
+        
+        With ``output_jsonl``, each successful result is appended (and fsynced) as it
+        completes and CVs already recorded there are skipped, so an interrupted run resumes.
+        Rows are keyed on the CV plus the job description and level, so a run with other
+        settings re-optimizes instead of reusing old results.
+        """
+        concurrency = self.llm_config.get('concurrency', self._endpoints.capacity)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(cv_texts)
+        
+        run_id = _run_id(job_description, optimization_level)
+        ids = [f"{id_fn(cv_text)}-{run_id}" for cv_text in cv_texts]
+        done = _read_checkpoint(output_jsonl) if output_jsonl else {}
+        pending = []
+        for idx, cv_text in enumerate(cv_texts):
+            if ids[idx] in done:
+                results[idx] = done[ids[idx]]
+            else:
+                pending.append((idx, cv_text))
+        if done:
+            logger.info(f"Resuming batch: {len(cv_texts) - len(pending)} of {len(cv_texts)} CVs already optimized")
+        
+        checkpoint = _open_checkpoint(output_jsonl) if output_jsonl and pending else None
+        checkpoint_lock = threading.Lock()
+        
+        def optimize_and_record(idx: int, cv_text: str) -> Dict[str, Any]:
+            # Runs in a worker thread, so the write and fsync never stall the event loop
+            result = self.optimize_cv(cv_text, job_description, optimization_level)
+            if checkpoint is not None and result.get('success'):
+                line = json_dumps({'id': ids[idx], **result}, indent=False) + b'\n'
+                with checkpoint_lock:
+                    checkpoint.write(line)
+                    checkpoint.flush()
+                    os.fsync(checkpoint.fileno())
+            return result
+        
+        try:
+            # Similar-length CVs share the server's parallel slots, so one long
+            # generation doesn't hold a slot while a bucket of short ones waits on it
+            for bucket in _length_buckets(pending):
+                semaphore = asyncio.Semaphore(concurrency)
+                
+                async def optimize_one(idx: int, cv_text: str):
+                    async with semaphore:
+                        results[idx] = await asyncio.to_thread(optimize_and_record, idx, cv_text)
+                
+                await asyncio.gather(*(optimize_one(idx, cv_text) for idx, cv_text in bucket))
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        
+        return results
+    
     def _prepare_optimization_context(self, cv_text: str, job_description: str, 
                                     optimization_level: str) -> Dict[str, Any]:
         """Prepare context for LLM optimization"""
-        # Get industry standards
-        standards = self.industry_standards.get_all_standards()
-        
         # Analyze current CV
         current_analysis = self._analyze_current_cv(cv_text)
         
@@ -74,59 +529,50 @@ class CVOptimizer:
             'job_description': job_description,
             'job_requirements': job_requirements,
             'optimization_level': optimization_level,
-            'industry_standards': standards,
+            'industry_standards': self._standards,
             'current_analysis': current_analysis,
             'optimization_guidelines': self._get_optimization_guidelines(optimization_level)
         }
     
     def _analyze_current_cv(self, cv_text: str) -> Dict[str, Any]:
-        """Quick analysis of current CV"""
-        lines = cv_text.split('\n')
-        bullets = [line for line in lines if line.strip().startswith(('•', '-', '*'))]
+        """Quick analysis of current CV (one pass over the lines)"""
+        total_bullets = quantified_bullets = word_count = 0
+        power_verbs = set()
+        sections = set()
         
-        # Count different elements
-        quantified_bullets = len([bullet for bullet in bullets 
-                                if any(char in bullet for char in ['%', '$', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9'])])
-        
-        # Action verb analysis
-        power_verbs = ['architected', 'orchestrated', 'spearheaded', 'optimized', 'transformed']
-        power_verb_count = sum(1 for verb in power_verbs if verb.lower() in cv_text.lower())
+        for line in cv_text.splitlines():
+            word_count += len(line.split())
+            
+            if _BULLET_RE.match(line):
+                total_bullets += 1
+                if _QUANT_RE.search(line):
+                    quantified_bullets += 1
+            
+            lower = line.lower()
+            power_verbs.update(_POWER_VERB_RE.findall(lower))
+            sections.update(match.lastgroup for match in _SECTION_RE.finditer(lower))
         
         return {
-            'total_bullets': len(bullets),
+            'total_bullets': total_bullets,
             'quantified_bullets': quantified_bullets,
-            'quantification_rate': (quantified_bullets / max(len(bullets), 1)) * 100,
-            'power_verb_count': power_verb_count,
-            'word_count': len(cv_text.split()),
-            'sections_detected': self._detect_sections(cv_text)
+            'quantification_rate': (quantified_bullets / max(total_bullets, 1)) * 100,
+            'power_verb_count': len(power_verbs),
+            'word_count': word_count,
+            'sections_detected': [section for section in _SECTION_NAMES if section in sections]
         }
     
     def _detect_sections(self, cv_text: str) -> List[str]:
         """Detect CV sections"""
-        sections = []
-        section_patterns = {
-            'summary': r'(summary|profile|objective)',
-            'experience': r'(experience|work|employment|career)',
-            'education': r'education',
-            'skills': r'skills',
-            'certifications': r'(certifications|certificates)',
-            'projects': r'projects'
-        }
-        
-        cv_lower = cv_text.lower()
-        for section, pattern in section_patterns.items():
-            if any(pattern in line for line in cv_lower.split('\n')):
-                sections.append(section)
-        
-        return sections
+        found = {match.lastgroup for match in _SECTION_RE.finditer(cv_text)}
+        return [section for section in _SECTION_NAMES if section in found]
     
     def _extract_job_requirements(self, job_description: str) -> Dict[str, Any]:
         """Extract key requirements from job description"""
         jd_lower = job_description.lower()
+        jd_tokens = _tokens(job_description)
         
-        # Technical skills
-        tech_skills = ['python', 'java', 'javascript', 'docker', 'kubernetes', 'aws', 'azure', 'devops']
-        required_skills = [skill for skill in tech_skills if skill in jd_lower]
+        # Technical skills (whole words, so 'java' no longer matches 'javascript' or 'aws' 'laws')
+        required_skills = [skill for skill in TECH_SKILLS if skill in jd_tokens]
         
         # Experience level
         experience_years = 0
@@ -141,52 +587,35 @@ class CVOptimizer:
             'required_skills': required_skills,
             'experience_years': experience_years,
             'key_responsibilities': self._extract_responsibilities(job_description),
-            'company_culture': self._extract_culture_keywords(job_description)
+            'company_culture': self._extract_culture_keywords(job_description, jd_tokens)
         }
     
     def _extract_responsibilities(self, job_description: str) -> List[str]:
         """Extract key responsibilities from JD"""
         # Simple extraction - could be enhanced
-        lines = job_description.split('\n')
         responsibilities = []
         
-        for line in lines:
-            if any(indicator in line.lower() for indicator in ['responsible for', 'will', 'you will']):
+        for line in job_description.splitlines():
+            line_lower = line.lower()
+            if any(indicator in line_lower for indicator in RESPONSIBILITY_INDICATORS):
                 responsibilities.append(line.strip())
+                if len(responsibilities) == 5:  # Limit to top 5
+                    break
         
-        return responsibilities[:5]  # Limit to top 5
+        return responsibilities
     
-    def _extract_culture_keywords(self, job_description: str) -> List[str]:
+    def _extract_culture_keywords(self, job_description: str,
+                                  jd_tokens: Optional[frozenset] = None) -> List[str]:
         """Extract company culture keywords"""
-        culture_keywords = ['collaborative', 'innovative', 'agile', 'fast-paced', 'team-oriented', 'entrepreneurial']
-        jd_lower = job_description.lower()
+        if jd_tokens is None:
+            jd_tokens = _tokens(job_description)
         
-        return [keyword for keyword in culture_keywords if keyword in jd_lower]
+        return [keyword for keyword in CULTURE_KEYWORDS if keyword in jd_tokens]
     
-    def _get_optimization_guidelines(self, optimization_level: str) -> Dict[str, Any]:
+    @staticmethod
+    def _get_optimization_guidelines(optimization_level: str) -> Dict[str, Any]:
         """Get optimization guidelines based on level"""
-        guidelines = {
-            'conservative': {
-                'max_changes_per_section': 2,
-                'preserve_structure': True,
-                'focus_areas': ['quantification', 'action_verbs'],
-                'risk_level': 'low'
-            },
-            'balanced': {
-                'max_changes_per_section': 4,
-                'preserve_structure': True,
-                'focus_areas': ['quantification', 'action_verbs', 'keywords', 'impact'],
-                'risk_level': 'medium'
-            },
-            'aggressive': {
-                'max_changes_per_section': 6,
-                'preserve_structure': False,
-                'focus_areas': ['complete_rewrite', 'quantification', 'action_verbs', 'keywords', 'impact', 'structure'],
-                'risk_level': 'high'
-            }
-        }
-        
-        return guidelines.get(optimization_level, guidelines['balanced'])
+        return OPTIMIZATION_GUIDELINES.get(optimization_level, OPTIMIZATION_GUIDELINES['balanced'])
     
     def _generate_optimizations(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate optimizations using LLM"""
@@ -207,86 +636,93 @@ class CVOptimizer:
     
     def _create_optimization_prompt(self, context: Dict[str, Any]) -> str:
         """Create optimization prompt for LLM"""
-        prompt = f"""
-You are an expert CV optimization specialist. Your task is to improve the following CV while maintaining its authenticity and factual accuracy.
-
-CURRENT CV:
-{context['cv_text']}
-
-OPTIMIZATION LEVEL: {context['optimization_level']}
-
-CURRENT ANALYSIS:
-- Total bullet points: {context['current_analysis']['total_bullets']}
-- Quantified bullets: {context['current_analysis']['quantified_bullets']} ({context['current_analysis']['quantification_rate']:.1f}%)
-- Power verbs used: {context['current_analysis']['power_verb_count']}
-
-OPTIMIZATION GUIDELINES:
-- Focus on: {', '.join(context['optimization_guidelines']['focus_areas'])}
-- Max changes per section: {context['optimization_guidelines']['max_changes_per_section']}
-- Risk level: {context['optimization_guidelines']['risk_level']}
-
-INDUSTRY STANDARDS TO FOLLOW:
-- Use Tier 1 action verbs: architected, orchestrated, spearheaded, optimized, transformed
-- Quantify 80%+ of achievements with specific numbers, percentages, or dollar amounts
-- Focus on impact and results, not just responsibilities
-- Use ATS-friendly formatting
-"""
+        level = context['optimization_level']
+        prompt_fn = self._prompt_fns.get(level) or _make_prompt_fn(level, context['optimization_guidelines'])
+        prompt = prompt_fn(context['cv_text'], context['current_analysis'])
+        
+        budget = self.llm_config.get('max_context', DEFAULT_MAX_CONTEXT) - GENERATION_TOKENS
         
         if context.get('job_description'):
-            prompt += f"""
+            job_description = context['job_description']
+            skills = ', '.join(context['job_requirements'].get('required_skills', []))
+            
+            # Trim the JD rather than let the server truncate (or reject) an oversized prompt
+            fixed_tokens = _estimate_tokens(prompt + self._job_section('', skills) + _RESPONSE_INSTRUCTIONS)
+            max_jd_chars = (budget - fixed_tokens) * 4
+            if len(job_description) > max_jd_chars >= MIN_JD_CHARS:
+                job_description = _excerpt(job_description, max_jd_chars)
+                self.prompt_stats['jd_trimmed'] += 1
+                logger.warning(f"Job description trimmed to ~{max_jd_chars} chars to fit the context window "
+                               f"({self.prompt_stats['jd_trimmed']} trimmed so far)")
+            
+            prompt += self._job_section(job_description, skills)
+        
+        prompt += _RESPONSE_INSTRUCTIONS
+        
+        prompt_tokens = _estimate_tokens(prompt)
+        if prompt_tokens > budget:
+            # Raising sends _generate_optimizations to the rule-based fallback
+            self.prompt_stats['over_budget'] += 1
+            raise ValueError(f"Prompt needs ~{prompt_tokens} tokens but only {budget} fit the context window "
+                             f"({self.prompt_stats['over_budget']} over budget so far)")
+        
+        return prompt
+    
+    @staticmethod
+    def _job_section(job_description: str, skills: str) -> str:
+        """Target-job part of the optimization prompt"""
+        return f"""
 
 TARGET JOB DESCRIPTION:
-{context['job_description']}
+{job_description}
 
 REQUIRED SKILLS TO EMPHASIZE:
-{', '.join(context['job_requirements'].get('required_skills', []))}
-"""
-        
-        prompt += """
-
-Please provide:
-1. An optimized version of the CV
-2. A list of specific improvements made
-3. Reasoning for each major change
-
-Return your response in this JSON format:
-{
-    "optimized_content": "[full optimized CV text]",
-    "improvements": [
-        {
-            "section": "[section name]",
-            "original": "[original text]",
-            "improved": "[improved text]",
-            "reason": "[reason for change]",
-            "impact_score": [1-10 rating]
-        }
-    ],
-    "summary": "[brief summary of optimizations made]"
-}
+{skills}
 """
-        
-        return prompt
     
-    def _call_llm_api(self, prompt: str) -> str:
-        """Call LLM API (Ollama)"""
+    def _call_llm_api(self, prompt: str,
+                      required_keys: Tuple[str, ...] = ('optimized_content', 'improvements')) -> str:
+        """Call LLM API (Ollama), streaming until a JSON object with ``required_keys`` closes"""
         try:
             if self.llm_config['provider'] == 'ollama':
-                url = f"{self.llm_config['base_url']}/api/generate"
                 payload = {
                     "model": self.llm_config['model'],
                     "prompt": prompt,
-                    "stream": False,
+                    "stream": True,
                     "options": {
                         "temperature": 0.3,
                         "top_p": 0.9,
-                        "max_tokens": 4000
+                        "max_tokens": 4000,
+                        "num_ctx": self.llm_config.get('max_context', DEFAULT_MAX_CONTEXT)
                     }
                 }
                 
-                response = requests.post(url, json=payload, timeout=120)
-                response.raise_for_status()
+                # Identical model/prompt/options always re-use the earlier answer
+                cache_key = self._response_cache.key(payload)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"LLM cache hit {cache_key}")
+                    return cached
+                
+                scanner = _JSONObjectScanner(required_keys)
+                text = None
+                with self._endpoints.post('/api/generate', json=payload, timeout=120, stream=True) as response:
+                    response.raise_for_status()
+                    
+                    # One JSON chunk per line; stop reading (and generating) once the result is complete
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = json.loads(line)
+                        text = scanner.feed(chunk.get('response', ''))
+                        if text is not None or chunk.get('done'):
+                            break
                 
-                return response.json().get('response', '')
+                # Only a complete object with the required keys is cached; prose or a cut-off stream is retried next time
+                if text is not None:
+                    self._response_cache.set(cache_key, text)
+                    return text
+                return scanner.text()
             
             else:
                 raise ValueError(f"Unsupported LLM provider: {self.llm_config['provider']}")
@@ -346,28 +782,17 @@ Return your response in this JSON format:
         optimized_lines = []
         
         for line in lines:
-            optimized_line = line
-            
-            # Replace weak verbs with stronger ones
-            verb_replacements = {
-                'worked on': 'developed',
-                'helped with': 'contributed to',
-                'was responsible for': 'managed',
-                'assisted': 'supported'
-            }
-            
-            original_line = line
-            for weak, strong in verb_replacements.items():
-                if weak in line.lower():
-                    optimized_line = line.lower().replace(weak, strong)
-                    if optimized_line != original_line:
-                        improvements.append({
-                            'section': 'experience',
-                            'original': original_line,
-                            'improved': optimized_line,
-                            'reason': f'Replaced weak verb "{weak}" with stronger "{strong}"',
-                            'impact_score': 6
-                        })
+            # Replace weak verbs with stronger ones, leaving the rest of the line untouched
+            optimized_line, replacements = _VERB_RE.subn(_stronger_verb, line)
+            if replacements:
+                for weak in dict.fromkeys(match.lower() for match in _VERB_RE.findall(line)):
+                    improvements.append({
+                        'section': 'experience',
+                        'original': line,
+                        'improved': optimized_line,
+                        'reason': f'Replaced weak verb "{weak}" with stronger "{VERB_REPLACEMENTS[weak]}"',
+                        'impact_score': 6
+                    })
             
             optimized_lines.append(optimized_line)
         
@@ -378,15 +803,21 @@ Return your response in this JSON format:
             'fallback_used': True
         }
     
-    def _validate_improvements(self, original: str, optimized: str) -> Dict[str, Any]:
+    def _validate_improvements(self, original: str, optimized: str,
+                               original_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Validate that improvements are actually better"""
-        original_analysis = self._analyze_current_cv(original)
-        optimized_analysis = self._analyze_current_cv(optimized)
+        if original_analysis is None:
+            original_analysis = self._analyze_current_cv(original)
+        # Fallbacks hand back the original text unchanged; don't analyse it twice
+        if optimized is original or optimized == original:
+            optimized_analysis = original_analysis
+        else:
+            optimized_analysis = self._analyze_current_cv(optimized)
         
         improvements = {
             'quantification_improvement': optimized_analysis['quantification_rate'] - original_analysis['quantification_rate'],
             'power_verb_improvement': optimized_analysis['power_verb_count'] - original_analysis['power_verb_count'],
-            'length_change': len(optimized.split()) - len(original.split()),
+            'length_change': optimized_analysis['word_count'] - original_analysis['word_count'],
             'bullet_count_change': optimized_analysis['total_bullets'] - original_analysis['total_bullets']
         }
         
@@ -457,8 +888,8 @@ Return your response in this JSON format:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(json_dumps(result))
             
             logger.info(f"Optimization result saved to {output_path}")
             return True
@@ -2,6 +2,10 @@
 
 import logging
 import re
+import numpy as np
+import pandas as pd
+from collections import ChainMap
+from types import MappingProxyType
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -10,36 +14,152 @@ from .industry_standards import IndustryStandards
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every scan, compiled once at import
+# Impact verbs and the figure that follows them, as one alternation so the text is scanned once
+_IMPACT_RE = re.compile(
+    r'(?P<reduction>reduced|decreased|cut).*?(\d+%|\d+)'
+    r'|(?P<growth>increased|improved|grew|boosted).*?(\d+%|\d+)'
+    r'|(?P<money>saved|generated).*?\$([\d,]+)'
+    r'|(?P<achievement>achieved|delivered).*?(\d+%|\d+)',
+    re.IGNORECASE
+)
+# Branches of these scanners never match overlapping text, so one pass finds what separate passes would
+_SCOPE_RE = re.compile(r'(?P<team>team of \d+|led \d+)|(?P<budget>\$[\d,]+|budget)')
+_CONSISTENCY_RE = re.compile(r'(?P<date>\d{4}|\d{1,2}/\d{4}|\w+ \d{4})|^\s*(?P<bullet>[•\-\*])', re.MULTILINE)
+_QUANTIFIED_RE = re.compile(r'\d+[%$]?|\$\d+')
+_EMAIL_RE = re.compile(r'[\w.-]+@[\w.-]+\.\w+')
+_WORD_RE = re.compile(r'[a-z0-9+#]+')
+# Plural endings stripped from CV tokens so 'teams' and 'apis' still match 'team' and 'api'
+_PLURAL_SUFFIXES = ('es', 's')
+
+# Role-specific keyword mapping
+ROLE_KEYWORDS = {
+    'devops': ('docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 'aws', 'ci/cd'),
+    'developer': ('python', 'java', 'javascript', 'react', 'node.js', 'api', 'database'),
+    'data': ('python', 'sql', 'machine learning', 'pandas', 'numpy', 'visualization'),
+    'manager': ('leadership', 'team', 'budget', 'strategy', 'stakeholder', 'project'),
+    'architect': ('design', 'architecture', 'system', 'scalability', 'microservices')
+}
+# Single words, so whole-word matching is a set intersection with the CV's words
+UNPROFESSIONAL_TERMS = frozenset({'awesome', 'cool', 'stuff', 'things', 'guys'})
+
+# Weights of the base-scan and enhanced-analysis scores in the enhanced overall score
+_BASE_SCORE_WEIGHTS = np.array([0.15, 0.20, 0.15, 0.10]) * 0.6
+_ENHANCED_SCORE_WEIGHTS = np.array([0.15, 0.08, 0.05, 0.07, 0.03, 0.02]) * 0.4
+# Decimal places weighted totals are rounded to before flooring to whole points
+_SCORE_DECIMALS = 6
+
+def _whole_points(totals):
+    """Floor weighted score totals to whole points, after rounding away float noise in the weights.
+    
+    Rounding to _SCORE_DECIMALS first means an exact total such as 36 computed as
+    35.99999999999999 scores 36, while a genuine 35.9 still scores 35.
+    """
+    return np.floor(np.round(totals, _SCORE_DECIMALS))
+
+# Keyword categories the enhanced scanner adds on top of ATSScanner.ats_keywords
+ENHANCED_KEYWORDS = MappingProxyType({
+    'tier1_verbs': (
+        'architected', 'orchestrated', 'spearheaded', 'pioneered', 'transformed',
+        'revolutionized', 'optimized', 'streamlined', 'automated', 'scaled'
+    ),
+    'tier2_verbs': (
+        'developed', 'implemented', 'created', 'built', 'designed', 'managed',
+        'led', 'delivered', 'executed', 'coordinated'
+    ),
+    'tier3_verbs': (
+        'assisted', 'helped', 'participated', 'supported', 'contributed',
+        'worked', 'involved', 'collaborated', 'engaged', 'handled'
+    ),
+    'leadership_indicators': (
+        'led team', 'managed', 'supervised', 'mentored', 'coached',
+        'directed', 'oversaw', 'guided', 'trained', 'developed team'
+    ),
+    'impact_indicators': (
+        'reduced', 'increased', 'improved', 'enhanced', 'optimized',
+        'decreased', 'accelerated', 'generated', 'saved', 'achieved'
+    )
+})
+
+def _strip_plural(tokens: List[str], suffix: str) -> List[str]:
+    """``tokens`` with a trailing ``suffix`` removed, leaving short words and '-ss' endings alone"""
+    return [
+        token[:-len(suffix)] if len(token) > len(suffix) + 2 and token.endswith(suffix) and not token.endswith('ss') else token
+        for token in tokens
+    ]
+
+def _bullet_depth_stats(word_counts: np.ndarray) -> Tuple[int, int, float]:
+    """Detailed bullets, weak bullets and average length from per-bullet word counts"""
+    if not word_counts.size:
+        return 0, 0, 0.0
+    detailed = np.count_nonzero(word_counts >= 12)  # Detailed description
+    weak = np.count_nonzero(word_counts <= 4)  # Too brief
+    return int(detailed), int(weak), float(word_counts.mean())
+
 class EnhancedATSScanner(ATSScanner):
     """Enhanced scanner with industry standards and advanced analysis"""
     
     def __init__(self):
         super().__init__()
         self.industry_standards = IndustryStandards()
+        self._standards = dict(self.industry_standards.get_all_standards())
+        self._standard_checks = {
+            'action_verb_hierarchy': self._check_action_verb_compliance,
+            'quantification_standard': self._check_quantification_compliance,
+            'ats_formatting': self._check_ats_formatting_compliance,
+            'keyword_optimization': self._check_keyword_compliance,
+            'professional_presentation': self._check_presentation_compliance,
+            'impact_demonstration': self._check_impact_compliance,
+            'role_alignment': self._check_alignment_compliance
+        }
+        
+        # Enhanced keyword categories layered over the base scanner's, shared by every instance
+        self.enhanced_keywords = ChainMap(ENHANCED_KEYWORDS, self.ats_keywords)
+        
+        # Every keyword any analyzer looks for, so one scan answers them all
+        self._all_keywords = tuple(dict.fromkeys(
+            [kw for keywords in self.enhanced_keywords.values() for kw in keywords] +
+            [kw for keywords in ROLE_KEYWORDS.values() for kw in keywords]
+        ))
+        
+        # Every tiered verb with its tier index, so one pass counts all three tiers
+        self._verb_catalog = tuple(
+            (verb, tier)
+            for tier, category in enumerate(('tier1_verbs', 'tier2_verbs', 'tier3_verbs'))
+            for verb in self.enhanced_keywords[category]
+        )
+        
+        # Relevant keywords per lowercased target role, resolved once per role
+        self._role_keywords: Dict[str, Tuple[str, ...]] = {}
         
-        # Enhanced keyword categories
-        self.enhanced_keywords = {
-            **self.ats_keywords,
-            'tier1_verbs': [
-                'architected', 'orchestrated', 'spearheaded', 'pioneered', 'transformed',
-                'revolutionized', 'optimized', 'streamlined', 'automated', 'scaled'
-            ],
-            'tier2_verbs': [
-                'developed', 'implemented', 'created', 'built', 'designed', 'managed',
-                'led', 'delivered', 'executed', 'coordinated'
-            ],
-            'tier3_verbs': [
-                'assisted', 'helped', 'participated', 'supported', 'contributed',
-                'worked', 'involved', 'collaborated', 'engaged', 'handled'
-            ],
-            'leadership_indicators': [
-                'led team', 'managed', 'supervised', 'mentored', 'coached',
-                'directed', 'oversaw', 'guided', 'trained', 'developed team'
-            ],
-            'impact_indicators': [
-                'reduced', 'increased', 'improved', 'enhanced', 'optimized',
-                'decreased', 'accelerated', 'generated', 'saved', 'achieved'
-            ]
+        # Keywords in the CV's token form ('ci/cd' -> 'ci cd'), matched as whole words or phrases
+        self._keyword_terms = {kw: ' '.join(_WORD_RE.findall(kw)) for kw in self._all_keywords}
+        self._phrase_lengths = sorted({len(term.split()) for term in self._keyword_terms.values()} - {1})
+    
+    def _build_context(self, cv_text: str) -> Dict[str, Any]:
+        """Derived forms of the CV text, computed once and shared by every analyzer"""
+        cv_lower = cv_text.lower()
+        lines = cv_text.splitlines()
+        bullet_lines = [line for line in lines if line.lstrip().startswith(('•', '-', '*'))]
+        tokens = _WORD_RE.findall(cv_lower)
+        words = set(tokens)
+        
+        # Words and their singular forms plus the multi-word phrases a keyword could be, so every lookup is a set probe
+        terms = set()
+        for forms in [tokens] + [_strip_plural(tokens, suffix) for suffix in _PLURAL_SUFFIXES]:
+            terms.update(forms)
+            for length in self._phrase_lengths:
+                terms.update(' '.join(forms[i:i + length]) for i in range(len(forms) - length + 1))
+        
+        return {
+            'text': cv_text,
+            'lower': cv_lower,
+            'lines': lines,
+            'bullet_lines': bullet_lines,
+            'quantified_mask': [bool(_QUANTIFIED_RE.search(line)) for line in bullet_lines],
+            'words': words,
+            # Keywords from every category that occur in the CV
+            'keyword_hits': frozenset(kw for kw, term in self._keyword_terms.items() if term in terms)
         }
     
     def enhanced_scan(self, cv_path: Path, job_description: str = "", 
@@ -52,19 +172,17 @@ class EnhancedATSScanner(ATSScanner):
             if 'error' in results:
                 return results
             
+            # Nothing to analyze, so report the empty result rather than scoring blank text
+            if results.get('reason') == 'no_text':
+                results['enhanced_score'] = 0
+                return results
+            
             # Extract CV text
             cv_text = self._extract_text(cv_path)
+            ctx = self._build_context(cv_text)
             
             # Add enhanced analysis
-            results['enhanced_analysis'] = {
-                'industry_standards': self._analyze_industry_standards(cv_text),
-                'verb_hierarchy': self._analyze_verb_hierarchy(cv_text),
-                'leadership_analysis': self._analyze_leadership_indicators(cv_text),
-                'impact_analysis': self._analyze_impact_statements(cv_text),
-                'role_alignment': self._analyze_role_alignment(cv_text, target_role),
-                'content_depth': self._analyze_content_depth(cv_text),
-                'professional_presentation': self._analyze_presentation(cv_text)
-            }
+            results['enhanced_analysis'] = self._enhanced_analysis(ctx, target_role)
             
             # Recalculate enhanced overall score
             results['enhanced_score'] = self._calculate_enhanced_score(
@@ -82,29 +200,94 @@ class EnhancedATSScanner(ATSScanner):
             logger.error(f"Error in enhanced scan: {e}")
             return {'error': str(e)}
     
-    def _analyze_industry_standards(self, cv_text: str) -> Dict[str, Any]:
+    def batch_enhanced_scan(self, cv_paths: List[Path], job_description: str = "",
+                            target_role: str = "") -> pd.DataFrame:
+        """Scan many CVs into one summary row each, scoring the whole batch at once"""
+        rows = []
+        hit_rows = []
+        base_rows = []
+        enhanced_rows = []
+        
+        for cv_path in cv_paths:
+            try:
+                results = self.scan_cv(cv_path, job_description)
+                if 'error' in results:
+                    rows.append({'cv_path': str(cv_path), 'error': results['error']})
+                    continue
+                if results.get('reason') == 'no_text':
+                    rows.append({'cv_path': str(cv_path), 'overall_score': 0, 'enhanced_score': 0,
+                                 'error': results['reason']})
+                    continue
+                
+                ctx = self._build_context(self._extract_text(cv_path))
+                enhanced_analysis = self._enhanced_analysis(ctx, target_role)
+            except Exception as e:
+                logger.error(f"Error in enhanced scan of {cv_path}: {e}")
+                rows.append({'cv_path': str(cv_path), 'error': str(e)})
+                continue
+            
+            base_scores, enhanced_scores = self._score_components(results['sections'], enhanced_analysis)
+            base_rows.append(base_scores)
+            enhanced_rows.append(enhanced_scores)
+            hit_rows.append([kw in ctx['keyword_hits'] for kw in self._all_keywords])
+            rows.append({
+                'cv_path': str(cv_path),
+                'overall_score': results['overall_score'],
+                'industry_compliance': enhanced_analysis['industry_standards']['overall_compliance_score'],
+                'alignment_score': enhanced_analysis['role_alignment'].get('alignment_score')
+            })
+        
+        summary = pd.DataFrame(rows, columns=['cv_path', 'overall_score', 'enhanced_score',
+                                              'industry_compliance', 'alignment_score', 'error'])
+        if not base_rows:
+            return summary
+        
+        # Every successfully scanned CV scored with two matrix products
+        scanned = summary['error'].isna().to_numpy()
+        totals = (np.array(base_rows, dtype=np.float64) @ _BASE_SCORE_WEIGHTS +
+                  np.array(enhanced_rows, dtype=np.float64) @ _ENHANCED_SCORE_WEIGHTS)
+        summary.loc[scanned, 'enhanced_score'] = _whole_points(totals).astype(int)
+        
+        # Keywords found per category, from the CV x keyword hit matrix
+        categories = list(self.enhanced_keywords)
+        category_matrix = np.array([[kw in self.enhanced_keywords[category] for category in categories]
+                                    for kw in self._all_keywords], dtype=np.int32)
+        category_counts = np.array(hit_rows, dtype=np.int32) @ category_matrix
+        for column, category in enumerate(categories):
+            summary.loc[scanned, f'{category}_found'] = category_counts[:, column]
+        
+        # Failed rows leave gaps, so keep the count columns integral with a nullable dtype
+        count_columns = ['overall_score', 'enhanced_score'] + [f'{category}_found' for category in categories]
+        return summary.astype({column: 'Int64' for column in count_columns})
+    
+    def _enhanced_analysis(self, ctx: Dict[str, Any], target_role: str) -> Dict[str, Any]:
+        """Run every analyzer, then the industry standards over their results"""
+        # Run the analyzers first so the standards checks can reuse their results
+        analysis = {
+            'verb_hierarchy': self._analyze_verb_hierarchy(ctx),
+            'leadership_analysis': self._analyze_leadership_indicators(ctx),
+            'impact_analysis': self._analyze_impact_statements(ctx),
+            'role_alignment': self._analyze_role_alignment(ctx, target_role),
+            'content_depth': self._analyze_content_depth(ctx),
+            'professional_presentation': self._analyze_presentation(ctx)
+        }
+        ctx['analysis'] = analysis
+        
+        return {
+            'industry_standards': self._analyze_industry_standards(ctx),
+            **analysis
+        }
+    
+    def _analyze_industry_standards(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze against 7 industry standards"""
         results = {}
         
-        for standard_name, standard in self.industry_standards.get_all_standards().items():
-            compliance_score = 0
-            findings = []
-            
+        # Checks run inline: they are set probes and reuse earlier analyzer results, and
+        # re holds the GIL, so handing them to a thread pool costs more than it saves
+        for standard_name, standard in self._standards.items():
             # Analyze based on standard criteria
-            if standard_name == 'action_verb_hierarchy':
-                compliance_score, findings = self._check_action_verb_compliance(cv_text, standard)
-            elif standard_name == 'quantification_standard':
-                compliance_score, findings = self._check_quantification_compliance(cv_text, standard)
-            elif standard_name == 'ats_formatting':
-                compliance_score, findings = self._check_ats_formatting_compliance(cv_text, standard)
-            elif standard_name == 'keyword_optimization':
-                compliance_score, findings = self._check_keyword_compliance(cv_text, standard)
-            elif standard_name == 'professional_presentation':
-                compliance_score, findings = self._check_presentation_compliance(cv_text, standard)
-            elif standard_name == 'impact_demonstration':
-                compliance_score, findings = self._check_impact_compliance(cv_text, standard)
-            elif standard_name == 'role_alignment':
-                compliance_score, findings = self._check_alignment_compliance(cv_text, standard)
+            checker = self._standard_checks.get(standard_name)
+            compliance_score, findings = checker(ctx, standard) if checker else (0, [])
             
             results[standard_name] = {
                 'score': compliance_score,
@@ -122,16 +305,12 @@ class EnhancedATSScanner(ATSScanner):
             'total_standards': len(results)
         }
     
-    def _analyze_verb_hierarchy(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_verb_hierarchy(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze action verb usage by tier"""
-        cv_lower = cv_text.lower()
+        hits = ctx['keyword_hits']
         
-        tier1_count = sum(1 for verb in self.enhanced_keywords['tier1_verbs'] 
-                         if verb in cv_lower)
-        tier2_count = sum(1 for verb in self.enhanced_keywords['tier2_verbs'] 
-                         if verb in cv_lower)
-        tier3_count = sum(1 for verb in self.enhanced_keywords['tier3_verbs'] 
-                         if verb in cv_lower)
+        found_tiers = np.fromiter((tier for verb, tier in self._verb_catalog if verb in hits), dtype=np.intp)
+        tier1_count, tier2_count, tier3_count = (int(count) for count in np.bincount(found_tiers, minlength=3))
         
         total_verbs = tier1_count + tier2_count + tier3_count
         
@@ -150,21 +329,22 @@ class EnhancedATSScanner(ATSScanner):
             'recommendation': self._get_verb_recommendation(tier1_count, tier2_count, tier3_count)
         }
     
-    def _analyze_leadership_indicators(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_leadership_indicators(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze leadership and management indicators"""
-        cv_lower = cv_text.lower()
+        cv_lower = ctx['lower']
+        hits = ctx['keyword_hits']
         
-        leadership_terms = []
-        for indicator in self.enhanced_keywords['leadership_indicators']:
-            if indicator in cv_lower:
-                leadership_terms.append(indicator)
+        leadership_terms = [indicator for indicator in self.enhanced_keywords['leadership_indicators']
+                            if indicator in hits]
         
-        # Look for team size indicators
-        team_sizes = re.findall(r'team of (\d+)|led (\d+)', cv_lower)
-        team_size_mentions = len(team_sizes)
-        
-        # Look for management scope
-        budget_mentions = len(re.findall(r'\$[\d,]+|budget', cv_lower))
+        # Look for team size indicators and management scope in one scan
+        team_size_mentions = 0
+        budget_mentions = 0
+        for match in _SCOPE_RE.finditer(cv_lower):
+            if match.lastgroup == 'team':
+                team_size_mentions += 1
+            else:
+                budget_mentions += 1
         
         leadership_score = min(
             (len(leadership_terms) * 15) + (team_size_mentions * 20) + (budget_mentions * 10),
@@ -179,93 +359,80 @@ class EnhancedATSScanner(ATSScanner):
             'leadership_score': leadership_score
         }
     
-    def _analyze_impact_statements(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_impact_statements(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze impact and achievement statements"""
-        # Find quantified impact statements
-        impact_patterns = [
-            r'(reduced|decreased|cut).*?(\d+%|\d+)',
-            r'(increased|improved|grew|boosted).*?(\d+%|\d+)',
-            r'(saved|generated).*?\$([\d,]+)',
-            r'(achieved|delivered).*?(\d+%|\d+)',
-        ]
-        
+        # Find quantified impact statements, keeping only the ones shown and counting the rest
         impact_statements = []
-        for pattern in impact_patterns:
-            matches = re.findall(pattern, cv_text, re.IGNORECASE)
-            for match in matches:
-                impact_statements.append(' '.join(match))
-        
-        # Analyze impact quality
-        high_impact_count = len([stmt for stmt in impact_statements 
-                               if any(term in stmt.lower() for term in ['million', '$', '%'])])
+        total_count = 0
+        high_impact_count = 0
+        for match in _IMPACT_RE.finditer(ctx['text']):
+            # Only the matching branch's verb and figure are set on each match
+            statement = ' '.join(group for group in match.groups() if group is not None)
+            total_count += 1
+            
+            # Analyze impact quality
+            statement_lower = statement.lower()
+            if 'million' in statement_lower or '$' in statement or '%' in statement:
+                high_impact_count += 1
+            
+            if len(impact_statements) < 10:  # Limit for display
+                impact_statements.append(statement)
         
-        impact_score = min((len(impact_statements) * 20) + (high_impact_count * 10), 100)
+        impact_score = min((total_count * 20) + (high_impact_count * 10), 100)
         
         return {
-            'impact_statements': impact_statements[:10],  # Limit for display
-            'total_impact_statements': len(impact_statements),
+            'impact_statements': impact_statements,
+            'total_impact_statements': total_count,
             'high_impact_statements': high_impact_count,
             'impact_score': impact_score
         }
     
-    def _analyze_role_alignment(self, cv_text: str, target_role: str) -> Dict[str, Any]:
+    def _analyze_role_alignment(self, ctx: Dict[str, Any], target_role: str) -> Dict[str, Any]:
         """Analyze alignment with target role"""
         if not target_role:
             return {'score': 50, 'message': 'No target role specified'}
         
-        # Role-specific keyword mapping
-        role_keywords = {
-            'devops': ['docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 'aws', 'ci/cd'],
-            'developer': ['python', 'java', 'javascript', 'react', 'node.js', 'api', 'database'],
-            'data': ['python', 'sql', 'machine learning', 'pandas', 'numpy', 'visualization'],
-            'manager': ['leadership', 'team', 'budget', 'strategy', 'stakeholder', 'project'],
-            'architect': ['design', 'architecture', 'system', 'scalability', 'microservices']
-        }
-        
-        target_lower = target_role.lower()
-        cv_lower = cv_text.lower()
-        
-        # Find matching role category
-        relevant_keywords = []
-        for role_type, keywords in role_keywords.items():
-            if role_type in target_lower:
-                relevant_keywords.extend(keywords)
+        relevant_keywords = self._relevant_role_keywords(target_role.lower())
         
-        if not relevant_keywords:
-            # Generic analysis if no specific role match
-            relevant_keywords = (self.enhanced_keywords['technical_skills'] + 
-                               self.enhanced_keywords['soft_skills'])
-        
-        # Count matches
-        matched_keywords = [kw for kw in relevant_keywords if kw in cv_lower]
+        # Count matches: one set probe per keyword, in display order
+        hits = ctx['keyword_hits']
+        matched_keywords = [kw for kw in relevant_keywords if kw in hits]
         alignment_score = (len(matched_keywords) / max(len(relevant_keywords), 1)) * 100
         
         return {
             'target_role': target_role,
-            'relevant_keywords': relevant_keywords[:20],  # Limit for display
+            'relevant_keywords': list(relevant_keywords[:20]),  # Limit for display
             'matched_keywords': matched_keywords[:15],
             'alignment_score': alignment_score,
             'recommendation': self._get_alignment_recommendation(alignment_score)
         }
     
-    def _analyze_content_depth(self, cv_text: str) -> Dict[str, Any]:
+    def _relevant_role_keywords(self, target_lower: str) -> Tuple[str, ...]:
+        """Keywords for every role category named in the target role"""
+        relevant_keywords = self._role_keywords.get(target_lower)
+        if relevant_keywords is None:
+            # Find matching role category
+            relevant_keywords = tuple(kw for role_type, keywords in ROLE_KEYWORDS.items()
+                                      if role_type in target_lower for kw in keywords)
+            
+            if not relevant_keywords:
+                # Generic analysis if no specific role match
+                relevant_keywords = tuple(self.enhanced_keywords['technical_skills'] + 
+                                          self.enhanced_keywords['soft_skills'])
+            
+            if len(self._role_keywords) >= 128:
+                self._role_keywords.clear()
+            self._role_keywords[target_lower] = relevant_keywords
+        return relevant_keywords
+    
+    def _analyze_content_depth(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze depth and quality of content"""
-        lines = cv_text.split('\n')
-        bullet_lines = [line for line in lines if line.strip().startswith(('•', '-', '*'))]
+        bullet_lines = ctx['bullet_lines']
         
-        # Analyze bullet point quality
-        detailed_bullets = 0
-        weak_bullets = 0
-        
-        for bullet in bullet_lines:
-            word_count = len(bullet.split())
-            if word_count >= 12:  # Detailed description
-                detailed_bullets += 1
-            elif word_count <= 4:  # Too brief
-                weak_bullets += 1
-        
-        # Content depth metrics
-        avg_bullet_length = sum(len(bullet.split()) for bullet in bullet_lines) / max(len(bullet_lines), 1)
+        # Analyze bullet point quality: one word count per bullet, then array arithmetic
+        word_counts = np.fromiter((len(bullet.split()) for bullet in bullet_lines),
+                                  dtype=np.int32, count=len(bullet_lines))
+        detailed_bullets, weak_bullets, avg_bullet_length = _bullet_depth_stats(word_counts)
         
         depth_score = min(
             (detailed_bullets * 15) - (weak_bullets * 5) + (avg_bullet_length * 2),
@@ -280,18 +447,24 @@ class EnhancedATSScanner(ATSScanner):
             'depth_score': max(depth_score, 0)
         }
     
-    def _analyze_presentation(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_presentation(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze professional presentation"""
-        # Check for consistency indicators
-        date_formats = len(set(re.findall(r'\d{4}|\d{1,2}/\d{4}|\w+ \d{4}', cv_text)))
+        # Check for consistency indicators: date and bullet styles from one scan,
+        # stopping once both are already known to be inconsistent
+        dates = set()
+        bullets = set()
+        for match in _CONSISTENCY_RE.finditer(ctx['text']):
+            if match.lastgroup == 'date':
+                dates.add(match.group('date'))
+            else:
+                bullets.add(match.group('bullet'))
+            if len(dates) > 2 and len(bullets) > 1:
+                break
+        date_formats = len(dates)
+        bullet_formats = len(bullets)
         
         # Check for professional language
-        unprofessional_terms = ['awesome', 'cool', 'stuff', 'things', 'guys']
-        unprofessional_count = sum(1 for term in unprofessional_terms 
-                                 if term in cv_text.lower())
-        
-        # Check for consistency in formatting
-        bullet_formats = len(set(re.findall(r'^\s*([•\-\*])', cv_text, re.MULTILINE)))
+        unprofessional_count = len(UNPROFESSIONAL_TERMS & ctx['words'])
         
         presentation_score = 100
         issues = []
@@ -319,25 +492,34 @@ class EnhancedATSScanner(ATSScanner):
     def _calculate_enhanced_score(self, base_sections: Dict[str, Any], 
                                 enhanced_analysis: Dict[str, Any]) -> int:
         """Calculate enhanced overall score"""
+        base_scores, enhanced_scores = self._score_components(base_sections, enhanced_analysis)
+        total = (np.array(base_scores, dtype=np.float64) @ _BASE_SCORE_WEIGHTS +
+                 np.array(enhanced_scores, dtype=np.float64) @ _ENHANCED_SCORE_WEIGHTS)
+        return int(_whole_points(total))
+    
+    @staticmethod
+    def _score_components(base_sections: Dict[str, Any],
+                          enhanced_analysis: Dict[str, Any]) -> Tuple[List[float], List[float]]:
+        """Component scores in the order of the base and enhanced weight vectors"""
         # Base score (60% weight)
-        base_score = sum([
-            base_sections['keywords'].get('power_verbs', {}).get('score', 0) * 0.15,
-            base_sections['keywords'].get('technical_skills', {}).get('score', 0) * 0.20,
-            base_sections['formatting'].get('overall_formatting_score', 0) * 0.15,
-            base_sections['ats_compatibility'].get('score', 0) * 0.10
-        ]) * 0.6
+        base_scores = [
+            base_sections['keywords'].get('power_verbs', {}).get('score', 0),
+            base_sections['keywords'].get('technical_skills', {}).get('score', 0),
+            base_sections['formatting'].get('overall_formatting_score', 0),
+            base_sections['ats_compatibility'].get('score', 0)
+        ]
         
         # Enhanced analysis (40% weight)
-        enhanced_score = sum([
-            enhanced_analysis['industry_standards']['overall_compliance_score'] * 0.15,
-            enhanced_analysis['verb_hierarchy']['tier_distribution_score'] * 0.08,
-            enhanced_analysis['leadership_analysis']['leadership_score'] * 0.05,
-            enhanced_analysis['impact_analysis']['impact_score'] * 0.07,
-            enhanced_analysis['content_depth']['depth_score'] * 0.03,
-            enhanced_analysis['professional_presentation']['presentation_score'] * 0.02
-        ]) * 0.4
-        
-        return int(base_score + enhanced_score)
+        enhanced_scores = [
+            enhanced_analysis['industry_standards']['overall_compliance_score'],
+            enhanced_analysis['verb_hierarchy']['tier_distribution_score'],
+            enhanced_analysis['leadership_analysis']['leadership_score'],
+            enhanced_analysis['impact_analysis']['impact_score'],
+            enhanced_analysis['content_depth']['depth_score'],
+            enhanced_analysis['professional_presentation']['presentation_score']
+        ]
+        
+        return base_scores, enhanced_scores
     
     def _generate_enhanced_recommendations(self, base_sections: Dict[str, Any], 
                                         enhanced_analysis: Dict[str, Any]) -> List[str]:
@@ -380,9 +562,9 @@ class EnhancedATSScanner(ATSScanner):
         return recommendations[:12]  # Limit to top 12
     
     # Helper methods for industry standard compliance checks
-    def _check_action_verb_compliance(self, cv_text: str, standard: Dict) -> Tuple[int, List[str]]:
-        cv_lower = cv_text.lower()
-        tier1_count = sum(1 for verb in self.enhanced_keywords['tier1_verbs'] if verb in cv_lower)
+    def _check_action_verb_compliance(self, ctx: Dict[str, Any], standard: Dict) -> Tuple[int, List[str]]:
+        hits = ctx['keyword_hits']
+        tier1_count = sum(1 for verb in self.enhanced_keywords['tier1_verbs'] if verb in hits)
         
         if tier1_count >= 5:
             return 90, ["Excellent use of Tier 1 action verbs"]
@@ -391,15 +573,13 @@ class EnhancedATSScanner(ATSScanner):
         else:
             return 50, ["Need more powerful Tier 1 action verbs"]
     
-    def _check_quantification_compliance(self, cv_text: str, standard: Dict) -> Tuple[int, List[str]]:
-        bullet_lines = re.findall(r'^\s*[•\-\*].*$', cv_text, re.MULTILINE)
-        quantified_bullets = [bullet for bullet in bullet_lines 
-                            if re.search(r'\d+[%$]?|\$\d+', bullet)]
+    def _check_quantification_compliance(self, ctx: Dict[str, Any], standard: Dict) -> Tuple[int, List[str]]:
+        quantified_mask = ctx['quantified_mask']
         
-        if not bullet_lines:
+        if not quantified_mask:
             return 0, ["No bullet points found"]
         
-        quantification_rate = len(quantified_bullets) / len(bullet_lines) * 100
+        quantification_rate = sum(quantified_mask) / len(quantified_mask) * 100
         
         if quantification_rate >= 80:
             return 95, ["Excellent quantification rate"]
@@ -408,23 +588,23 @@ class EnhancedATSScanner(ATSScanner):
         else:
             return int(quantification_rate), [f"Only {quantification_rate:.1f}% of bullets quantified"]
     
-    def _check_ats_formatting_compliance(self, cv_text: str, standard: Dict) -> Tuple[int, List[str]]:
+    def _check_ats_formatting_compliance(self, ctx: Dict[str, Any], standard: Dict) -> Tuple[int, List[str]]:
         issues = []
         score = 100
         
-        if '\t' in cv_text:
+        if '\t' in ctx['text']:
             issues.append("Remove tab characters")
             score -= 20
         
-        if not re.search(r'[\w.-]+@[\w.-]+\.\w+', cv_text):
+        if not _EMAIL_RE.search(ctx['text']):
             issues.append("Add proper email format")
             score -= 30
         
         return max(score, 0), issues if issues else ["ATS formatting compliant"]
     
-    def _check_keyword_compliance(self, cv_text: str, standard: Dict) -> Tuple[int, List[str]]:
-        cv_lower = cv_text.lower()
-        tech_count = sum(1 for skill in self.enhanced_keywords['technical_skills'] if skill in cv_lower)
+    def _check_keyword_compliance(self, ctx: Dict[str, Any], standard: Dict) -> Tuple[int, List[str]]:
+        hits = ctx['keyword_hits']
+        tech_count = sum(1 for skill in self.enhanced_keywords['technical_skills'] if skill in hits)
         
         if tech_count >= 12:
             return 90, ["Strong keyword presence"]
@@ -433,14 +613,15 @@ class EnhancedATSScanner(ATSScanner):
         else:
             return 50, ["Need more relevant technical keywords"]
     
-    def _check_presentation_compliance(self, cv_text: str, standard: Dict) -> Tuple[int, List[str]]:
-        return self._analyze_presentation(cv_text)['presentation_score'], []
+    def _check_presentation_compliance(self, ctx: Dict[str, Any], standard: Dict) -> Tuple[int, List[str]]:
+        presentation = ctx.get('analysis', {}).get('professional_presentation') or self._analyze_presentation(ctx)
+        return presentation['presentation_score'], []
     
-    def _check_impact_compliance(self, cv_text: str, standard: Dict) -> Tuple[int, List[str]]:
-        impact_analysis = self._analyze_impact_statements(cv_text)
+    def _check_impact_compliance(self, ctx: Dict[str, Any], standard: Dict) -> Tuple[int, List[str]]:
+        impact_analysis = ctx.get('analysis', {}).get('impact_analysis') or self._analyze_impact_statements(ctx)
         return impact_analysis['impact_score'], []
     
-    def _check_alignment_compliance(self, cv_text: str, standard: Dict) -> Tuple[int, List[str]]:
+    def _check_alignment_compliance(self, ctx: Dict[str, Any], standard: Dict) -> Tuple[int, List[str]]:
         # Generic alignment check
         return 70, ["Role alignment requires specific target role"]
     
@@ -0,0 +1,43 @@
+"""Fuzzy Matching - bounded edit distance for near-miss keyword spellings"""
+
+import threading
+from array import array
+from typing import Tuple
+
+# Per-thread DP rows, grown on demand and reused across calls
+_rows = threading.local()
+
+def _dp_rows(size: int) -> Tuple[array, array]:
+    """Two integer rows of at least ``size`` cells owned by the calling thread"""
+    rows = getattr(_rows, 'pair', None)
+    if rows is None or len(rows[0]) < size:
+        rows = (array('i', [0]) * size, array('i', [0]) * size)
+        _rows.pair = rows
+    return rows
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """Levenshtein distance between ``a`` and ``b``, or ``max_distance + 1`` as soon as it must exceed the bound"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+    
+    # Two rolling rows over the shorter string instead of a full len(a) x len(b) matrix
+    n = len(b)
+    previous, current = _dp_rows(n + 1)
+    for j in range(n + 1):
+        previous[j] = j
+    
+    for i, char_a in enumerate(a, 1):
+        current[0] = row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        # Every later row is at least this row's minimum, so the bound can no longer be met
+        if row_min > max_distance:
+            return max_distance + 1
+        previous, current = current, previous
+    
+    return min(previous[n], max_distance + 1)
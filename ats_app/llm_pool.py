@@ -0,0 +1,120 @@
+"""LLM Endpoint Pool - least-loaded routing across several Ollama servers"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator, Optional, Set
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+COOLDOWN_SECONDS = 10.0
+
+class RateLimiter:
+    """Space calls at least 1/qps seconds apart across all threads"""
+    
+    def __init__(self, qps: float):
+        self.interval = 1.0 / qps
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until this caller's slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+class LLMEndpoint:
+    """One LLM server and the number of generations it runs at once"""
+    
+    def __init__(self, base_url: str, concurrency: int):
+        self.base_url = base_url.rstrip('/')
+        self.capacity = max(int(concurrency), 1)
+        self.inflight = 0
+        self.cooldown_until = 0.0
+        self.slots = threading.BoundedSemaphore(self.capacity)
+    
+    def __repr__(self) -> str:
+        return f"LLMEndpoint({self.base_url!r}, inflight={self.inflight}/{self.capacity})"
+
+class LLMEndpointPool:
+    """Route requests to the least-loaded endpoint, failing over past ones that error"""
+    
+    def __init__(self, endpoints: List[Dict[str, Any]], session: requests.Session,
+                 cooldown: float = COOLDOWN_SECONDS, qps: Optional[float] = None):
+        if not endpoints:
+            raise ValueError("LLMEndpointPool needs at least one endpoint")
+        self.endpoints = [LLMEndpoint(e['base_url'], e.get('concurrency', 1)) for e in endpoints]
+        self.session = session
+        self.cooldown = cooldown
+        self._limiter = RateLimiter(qps) if qps else None
+        self._lock = threading.Lock()
+    
+    @property
+    def capacity(self) -> int:
+        """Total concurrent generations across all endpoints"""
+        return sum(endpoint.capacity for endpoint in self.endpoints)
+    
+    def _acquire(self, exclude: Set[LLMEndpoint]) -> Optional[LLMEndpoint]:
+        """Reserve the least-loaded endpoint not yet tried, preferring ones not cooling down"""
+        with self._lock:
+            now = time.monotonic()
+            candidates = [e for e in self.endpoints if e not in exclude]
+            if not candidates:
+                return None
+            healthy = [e for e in candidates if e.cooldown_until <= now]
+            endpoint = min(healthy or candidates, key=lambda e: e.inflight / e.capacity)
+            endpoint.inflight += 1
+            return endpoint
+    
+    def _release(self, endpoint: LLMEndpoint, failed: bool = False):
+        with self._lock:
+            endpoint.inflight -= 1
+            if failed:
+                endpoint.cooldown_until = time.monotonic() + self.cooldown
+    
+    @contextmanager
+    def post(self, path: str, **kwargs) -> Iterator[requests.Response]:
+        """POST ``path`` to the best endpoint; the slot is held until the response is closed.
+        
+        Connection errors, 429s and 5xx answers put that endpoint in cooldown and the request
+        moves to the next one; the last error is raised once every endpoint has failed.
+        """
+        tried: Set[LLMEndpoint] = set()
+        last_error: Optional[Exception] = None
+        
+        while True:
+            endpoint = self._acquire(tried)
+            if endpoint is None:
+                raise last_error
+            tried.add(endpoint)
+            
+            with endpoint.slots:
+                if self._limiter is not None:
+                    self._limiter.acquire()
+                try:
+                    response = self.session.post(f"{endpoint.base_url}{path}", **kwargs)
+                    # Still throttled or failing after the adapter's own retries: try another endpoint
+                    if response.status_code == 429 or response.status_code >= 500:
+                        response.close()
+                        raise requests.HTTPError(
+                            f"{response.status_code} Error from {endpoint.base_url}", response=response
+                        )
+                except requests.RequestException as e:
+                    last_error = e
+                    logger.warning(f"LLM endpoint {endpoint.base_url} failed, cooling down "
+                                   f"for {self.cooldown:.0f}s: {e}")
+                    self._release(endpoint, failed=True)
+                    continue
+                
+                try:
+                    with response:
+                        yield response
+                finally:
+                    self._release(endpoint)
+                return
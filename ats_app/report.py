@@ -1,18 +1,100 @@
 """Report Generation Module"""
 
+import bisect
+import copy
+import csv
+import hashlib
+import io
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-import json
-import pandas as pd
+from types import MappingProxyType
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from .utils import json_dumps
+
+try:
+    import ahocorasick
+except ImportError:  # fall back to one substring test per keyword
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Keywords the recommendation classifiers look for
+HIGH_IMPACT_KEYWORDS = frozenset({'quantif', 'action verb', 'ats', 'keyword', 'achievement'})
+MEDIUM_IMPACT_KEYWORDS = frozenset({'format', 'section', 'bullet', 'professional'})
+LOW_EFFORT_KEYWORDS = frozenset({'add', 'include', 'fix', 'remove'})
+HIGH_EFFORT_KEYWORDS = frozenset({'rewrite', 'restructure', 'complete', 'overhaul'})
+# Checked in order; the first category with a matching keyword wins
+RECOMMENDATION_CATEGORIES = (
+    ('content', frozenset({'quantif', 'achievement', 'bullet', 'verb'})),
+    ('formatting', frozenset({'format', 'section', 'ats'})),
+    ('keywords', frozenset({'keyword', 'skill', 'technical'})),
+    ('structure', frozenset({'section', 'summary', 'experience'}))
+)
+_CLASSIFIER_KEYWORDS = frozenset().union(
+    HIGH_IMPACT_KEYWORDS, MEDIUM_IMPACT_KEYWORDS, LOW_EFFORT_KEYWORDS, HIGH_EFFORT_KEYWORDS,
+    *(keywords for _, keywords in RECOMMENDATION_CATEGORIES)
+)
+
+def _build_keyword_automaton():
+    """One Aho-Corasick automaton over every classifier keyword, if pyahocorasick is installed"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _CLASSIFIER_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _matched_keywords(text_lower: str) -> frozenset:
+    """Classifier keywords occurring anywhere in ``text_lower``, found in a single pass when possible"""
+    if _KEYWORD_AUTOMATON is not None:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text_lower))
+    return frozenset(keyword for keyword in _CLASSIFIER_KEYWORDS if keyword in text_lower)
+
+REPORT_CACHE_SIZE = 32
+
+# Shared stand-in for a missing section; read-only so it can never pick up stray keys
+_EMPTY = MappingProxyType({})
+
+def _lookup(mapping: Dict[str, Any], section: str, field: str, default: Any = 0) -> Any:
+    """``mapping[section][field]``, treating a missing or empty section as having no fields"""
+    return (mapping.get(section) or _EMPTY).get(field, default)
+
+# Grade bands: a score at or above GRADE_THRESHOLDS[i] (and below the next) gets GRADES[i + 1]
+GRADE_THRESHOLDS = (60, 70, 80, 90)
+GRADES = (
+    ('D', 'Significant Improvements Required'),
+    ('C', 'Needs Improvement'),
+    ('B', 'Good'),
+    ('A', 'Very Good'),
+    ('A+', 'Excellent')
+)
+
+# Score thresholds the overall score is compared against
+BENCHMARKS = (
+    ('industry_average', 65),
+    ('top_10_percent', 85),
+    ('ats_passing_threshold', 70),
+    ('interview_likely_threshold', 80)
+)
+
 class ReportGenerator:
     """Generate comprehensive reports for CV analysis and optimization"""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = REPORT_CACHE_SIZE):
+        # Finished reports keyed by a hash of their inputs
+        self._report_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._report_cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        
         self.report_templates = {
             'executive_summary': self._create_executive_summary,
             'detailed_analysis': self._create_detailed_analysis,
@@ -24,28 +106,20 @@ class ReportGenerator:
     def generate_comprehensive_report(self, analysis_results: Dict[str, Any], 
                                     optimization_results: Optional[Dict[str, Any]] = None,
                                     output_path: Optional[Path] = None) -> Dict[str, Any]:
-        """Generate comprehensive report combining analysis and optimization"""
+        """Generate comprehensive report combining analysis and optimization.
+        
+        Identical inputs reuse a cached report; each caller gets its own copy with fresh metadata.
+        """
         try:
-            report = {
-                'metadata': {
-                    'generated_at': datetime.now().isoformat(),
-                    'report_type': 'comprehensive_cv_analysis',
-                    'cv_analyzed': analysis_results.get('cv_path', 'Unknown'),
-                    'analysis_timestamp': analysis_results.get('timestamp'),
-                    'optimization_applied': optimization_results is not None
-                },
-                'executive_summary': self._create_executive_summary(analysis_results, optimization_results),
-                'detailed_analysis': self._create_detailed_analysis(analysis_results),
-                'ats_compliance': self._create_ats_compliance_report(analysis_results),
-                'improvement_recommendations': self._create_improvement_recommendations(analysis_results),
-                'performance_metrics': self._create_performance_metrics(analysis_results)
-            }
-            
-            # Add optimization comparison if available
-            if optimization_results:
-                report['optimization_comparison'] = self._create_comparison_report(
-                    analysis_results, optimization_results
-                )
+            key = self._report_key(analysis_results, optimization_results)
+            cached = self._cached_report(key)
+            if cached is not None:
+                report = copy.deepcopy(cached)
+                report['metadata'] = self._report_metadata(analysis_results, optimization_results)
+            else:
+                report = dict(self._report_sections(analysis_results, optimization_results))
+                if key is not None:
+                    self._remember_report(key, copy.deepcopy(report))
             
             # Save report if path provided
             if output_path:
@@ -57,6 +131,92 @@ class ReportGenerator:
             logger.error(f"Error generating comprehensive report: {e}")
             return {'error': str(e)}
     
+    def stream_comprehensive_report(self, analysis_results: Dict[str, Any], output_path: Path,
+                                    optimization_results: Optional[Dict[str, Any]] = None) -> bool:
+        """Write the comprehensive JSON report section by section, without holding it all in memory"""
+        try:
+            json_path = output_path.with_suffix('.json')
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            self._stream_report(analysis_results, optimization_results, json_path)
+            logger.info(f"Report streamed to {json_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error streaming report: {e}")
+            return False
+    
+    @staticmethod
+    def _report_key(analysis_results: Dict[str, Any],
+                    optimization_results: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """BLAKE2b of the report inputs, or None when they cannot be serialized"""
+        try:
+            raw = json_dumps([analysis_results, optimization_results], indent=False)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(raw, digest_size=16).digest()
+    
+    def _cached_report(self, key: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._report_cache.get(key)
+            if cached is not None:
+                self._report_cache.move_to_end(key)
+            return cached
+    
+    def _remember_report(self, key: bytes, report: Dict[str, Any]):
+        with self._cache_lock:
+            self._report_cache[key] = report
+            self._report_cache.move_to_end(key)
+            if len(self._report_cache) > self._report_cache_size:
+                self._report_cache.popitem(last=False)
+    
+    @staticmethod
+    def _report_metadata(analysis_results: Dict[str, Any],
+                         optimization_results: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Metadata section, stamped with the time it is built"""
+        return {
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'report_type': 'comprehensive_cv_analysis',
+            'cv_analyzed': analysis_results.get('cv_path', 'Unknown'),
+            'analysis_timestamp': analysis_results.get('timestamp'),
+            'optimization_applied': optimization_results is not None
+        }
+    
+    def _report_sections(self, analysis_results: Dict[str, Any],
+                         optimization_results: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (name, section) pairs in report order, building each section only when reached"""
+        yield 'metadata', self._report_metadata(analysis_results, optimization_results)
+        yield 'executive_summary', self._create_executive_summary(analysis_results, optimization_results)
+        yield 'detailed_analysis', self._create_detailed_analysis(analysis_results)
+        yield 'ats_compliance', self._create_ats_compliance_report(analysis_results)
+        yield 'improvement_recommendations', self._create_improvement_recommendations(analysis_results)
+        yield 'performance_metrics', self._create_performance_metrics(analysis_results)
+        
+        # Add optimization comparison if available
+        if optimization_results:
+            yield 'optimization_comparison', self._create_comparison_report(
+                analysis_results, optimization_results
+            )
+    
+    def _stream_report(self, analysis_results: Dict[str, Any],
+                       optimization_results: Optional[Dict[str, Any]], json_path: Path) -> None:
+        """Serialize and write one top-level section at a time; the file appears only once complete"""
+        tmp_path = json_path.with_name(json_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                separator = b'{\n  '
+                for name, section in self._report_sections(analysis_results, optimization_results):
+                    # Nest the section's own 2-space indentation one level deeper; newlines inside
+                    # JSON strings are escaped, so every raw newline is a layout newline
+                    f.write(separator + json_dumps(name) + b': ' + json_dumps(section).replace(b'\n', b'\n  '))
+                    separator = b',\n  '
+                f.write(b'\n}')
+            os.replace(tmp_path, json_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    
     def _create_executive_summary(self, analysis_results: Dict[str, Any], 
                                 optimization_results: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create executive summary section"""
@@ -65,21 +225,9 @@ class ReportGenerator:
             enhanced_score = analysis_results.get('enhanced_score', overall_score)
             
             # Determine grade
-            if enhanced_score >= 90:
-                grade = 'A+'
-                assessment = 'Excellent'
-            elif enhanced_score >= 80:
-                grade = 'A'
-                assessment = 'Very Good'
-            elif enhanced_score >= 70:
-                grade = 'B'
-                assessment = 'Good'
-            elif enhanced_score >= 60:
-                grade = 'C'
-                assessment = 'Needs Improvement'
-            else:
-                grade = 'D'
-                assessment = 'Significant Improvements Required'
+            grade, assessment = GRADES[bisect.bisect_right(GRADE_THRESHOLDS, enhanced_score)]
+            
+            ats_score = _lookup(analysis_results.get('sections') or _EMPTY, 'ats_compatibility', 'score')
             
             # Key strengths and weaknesses
             strengths = self._identify_strengths(analysis_results)
@@ -99,8 +247,8 @@ class ReportGenerator:
                 'critical_weaknesses': weaknesses[:3],
                 'priority_actions': priority_actions[:5],
                 'ats_readiness': {
-                    'score': analysis_results.get('sections', {}).get('ats_compatibility', {}).get('score', 0),
-                    'status': 'Ready' if analysis_results.get('sections', {}).get('ats_compatibility', {}).get('score', 0) >= 80 else 'Needs Work'
+                    'score': ats_score,
+                    'status': 'Ready' if ats_score >= 80 else 'Needs Work'
                 }
             }
             
@@ -122,22 +270,22 @@ class ReportGenerator:
     def _create_detailed_analysis(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create detailed analysis section"""
         try:
-            sections = analysis_results.get('sections', {})
-            enhanced_analysis = analysis_results.get('enhanced_analysis', {})
+            sections = analysis_results.get('sections') or _EMPTY
+            enhanced_analysis = analysis_results.get('enhanced_analysis') or _EMPTY
             
             detailed = {
                 'content_analysis': {
-                    'word_count': sections.get('content_quality', {}).get('word_count', 0),
-                    'bullet_points': sections.get('content_quality', {}).get('bullet_points', 0),
-                    'quantified_achievements': sections.get('quantification', {}).get('quantified_bullets', 0),
-                    'quantification_rate': sections.get('quantification', {}).get('quantification_rate', 0),
-                    'sections_found': sections.get('formatting', {}).get('sections', {})
+                    'word_count': _lookup(sections, 'content_quality', 'word_count'),
+                    'bullet_points': _lookup(sections, 'content_quality', 'bullet_points'),
+                    'quantified_achievements': _lookup(sections, 'quantification', 'quantified_bullets'),
+                    'quantification_rate': _lookup(sections, 'quantification', 'quantification_rate'),
+                    'sections_found': _lookup(sections, 'formatting', 'sections', {})
                 },
-                'keyword_analysis': sections.get('keywords', {}),
+                'keyword_analysis': sections.get('keywords') or {},
                 'formatting_analysis': {
-                    'ats_compatibility_score': sections.get('ats_compatibility', {}).get('score', 0),
-                    'formatting_issues': sections.get('ats_compatibility', {}).get('issues', []),
-                    'section_completeness': sections.get('formatting', {}).get('section_score', 0)
+                    'ats_compatibility_score': _lookup(sections, 'ats_compatibility', 'score'),
+                    'formatting_issues': _lookup(sections, 'ats_compatibility', 'issues', []),
+                    'section_completeness': _lookup(sections, 'formatting', 'section_score')
                 }
             }
             
@@ -159,8 +307,9 @@ class ReportGenerator:
     def _create_ats_compliance_report(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create ATS compliance focused report"""
         try:
-            ats_data = analysis_results.get('sections', {}).get('ats_compatibility', {})
-            formatting_data = analysis_results.get('sections', {}).get('formatting', {})
+            sections = analysis_results.get('sections') or _EMPTY
+            ats_data = sections.get('ats_compatibility') or _EMPTY
+            formatting_data = sections.get('formatting') or _EMPTY
             
             compliance = {
                 'overall_score': ats_data.get('score', 0),
@@ -171,7 +320,7 @@ class ReportGenerator:
                     'bullet_point_usage': formatting_data.get('bullet_points', 0),
                     'consistency_score': formatting_data.get('section_score', 0)
                 },
-                'keyword_optimization': analysis_results.get('sections', {}).get('keywords', {}),
+                'keyword_optimization': sections.get('keywords') or {},
                 'recommendations': [
                     'Use standard section headers (Experience, Education, Skills)',
                     'Include complete contact information',
@@ -216,11 +365,12 @@ class ReportGenerator:
             
             # Categorize recommendations by priority and effort
             for rec in all_recommendations:
+                impact, effort, category = self._score_recommendation(rec)
                 rec_item = {
                     'recommendation': rec,
-                    'estimated_impact': self._estimate_impact(rec),
-                    'effort_level': self._estimate_effort(rec),
-                    'category': self._categorize_recommendation(rec)
+                    'estimated_impact': impact,
+                    'effort_level': effort,
+                    'category': category
                 }
                 
                 # Assign to priority levels
@@ -260,24 +410,31 @@ class ReportGenerator:
             validation = optimization_results.get('validation', {})
             improvements = optimization_results.get('improvements', [])
             
+            # One pass over the improvements for both the sections touched and the mean impact
+            sections_modified = set()
+            total_impact = 0
+            for imp in improvements:
+                sections_modified.add(imp.get('section', ''))
+                total_impact += imp.get('impact_score', 5)
+            
             comparison = {
                 'score_comparison': {
                     'original_score': analysis_results.get('overall_score', 0),
-                    'optimized_score': validation.get('optimized_analysis', {}).get('overall_score', 0),
+                    'optimized_score': _lookup(validation, 'optimized_analysis', 'overall_score'),
                     'improvement': validation.get('improvement_score', 0)
                 },
                 'metric_improvements': validation.get('improvements', {}),
                 'changes_summary': {
                     'total_improvements': len(improvements),
-                    'sections_modified': len(set(imp.get('section', '') for imp in improvements)),
-                    'average_impact_score': sum(imp.get('impact_score', 5) for imp in improvements) / max(len(improvements), 1)
+                    'sections_modified': len(sections_modified),
+                    'average_impact_score': total_impact / len(improvements) if improvements else 0.0
                 },
                 'detailed_changes': improvements[:10],  # Limit to top 10 changes
                 'validation_results': {
                     'passed': validation.get('validation_passed', False),
-                    'quantification_improvement': validation.get('improvements', {}).get('quantification_improvement', 0),
-                    'power_verb_improvement': validation.get('improvements', {}).get('power_verb_improvement', 0),
-                    'length_change': validation.get('improvements', {}).get('length_change', 0)
+                    'quantification_improvement': _lookup(validation, 'improvements', 'quantification_improvement'),
+                    'power_verb_improvement': _lookup(validation, 'improvements', 'power_verb_improvement'),
+                    'length_change': _lookup(validation, 'improvements', 'length_change')
                 }
             }
             
@@ -290,15 +447,15 @@ class ReportGenerator:
     def _create_performance_metrics(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create performance metrics dashboard"""
         try:
-            sections = analysis_results.get('sections', {})
-            enhanced_analysis = analysis_results.get('enhanced_analysis', {})
+            sections = analysis_results.get('sections') or _EMPTY
+            enhanced_analysis = analysis_results.get('enhanced_analysis') or _EMPTY
             
             metrics = {
                 'readability_score': self._calculate_readability_score(sections),
                 'keyword_density': self._calculate_keyword_density(sections),
                 'impact_score': self._calculate_impact_score(sections, enhanced_analysis),
                 'professional_score': self._calculate_professional_score(sections, enhanced_analysis),
-                'ats_optimization_score': sections.get('ats_compatibility', {}).get('score', 0),
+                'ats_optimization_score': _lookup(sections, 'ats_compatibility', 'score'),
                 'benchmark_comparison': self._create_benchmark_comparison(analysis_results)
             }
             
@@ -311,22 +468,23 @@ class ReportGenerator:
     def _identify_strengths(self, analysis_results: Dict[str, Any]) -> List[str]:
         """Identify CV strengths"""
         strengths = []
-        sections = analysis_results.get('sections', {})
+        sections = analysis_results.get('sections') or _EMPTY
+        keywords = sections.get('keywords') or _EMPTY
+        enhanced = analysis_results.get('enhanced_analysis') or _EMPTY
         
-        if sections.get('quantification', {}).get('quantification_rate', 0) >= 70:
+        if _lookup(sections, 'quantification', 'quantification_rate') >= 70:
             strengths.append("Strong quantification of achievements")
         
-        if sections.get('keywords', {}).get('technical_skills', {}).get('count', 0) >= 8:
+        if _lookup(keywords, 'technical_skills', 'count') >= 8:
             strengths.append("Good technical keyword coverage")
         
-        if sections.get('ats_compatibility', {}).get('score', 0) >= 80:
+        if _lookup(sections, 'ats_compatibility', 'score') >= 80:
             strengths.append("ATS-friendly formatting")
         
-        enhanced = analysis_results.get('enhanced_analysis', {})
-        if enhanced.get('verb_hierarchy', {}).get('tier1_count', 0) >= 3:
+        if _lookup(enhanced, 'verb_hierarchy', 'tier1_count') >= 3:
             strengths.append("Uses powerful action verbs")
         
-        if enhanced.get('leadership_analysis', {}).get('leadership_score', 0) >= 60:
+        if _lookup(enhanced, 'leadership_analysis', 'leadership_score') >= 60:
             strengths.append("Demonstrates leadership experience")
         
         return strengths if strengths else ["Basic structure present"]
@@ -334,22 +492,24 @@ class ReportGenerator:
     def _identify_weaknesses(self, analysis_results: Dict[str, Any]) -> List[str]:
         """Identify CV weaknesses"""
         weaknesses = []
-        sections = analysis_results.get('sections', {})
+        sections = analysis_results.get('sections') or _EMPTY
+        keywords = sections.get('keywords') or _EMPTY
+        formatting = sections.get('formatting') or _EMPTY
+        enhanced = analysis_results.get('enhanced_analysis') or _EMPTY
         
-        if sections.get('quantification', {}).get('quantification_rate', 0) < 50:
+        if _lookup(sections, 'quantification', 'quantification_rate') < 50:
             weaknesses.append("Insufficient quantification of achievements")
         
-        if sections.get('keywords', {}).get('power_verbs', {}).get('count', 0) < 5:
+        if _lookup(keywords, 'power_verbs', 'count') < 5:
             weaknesses.append("Limited use of strong action verbs")
         
-        if sections.get('ats_compatibility', {}).get('score', 0) < 70:
+        if _lookup(sections, 'ats_compatibility', 'score') < 70:
             weaknesses.append("ATS compatibility issues")
         
-        enhanced = analysis_results.get('enhanced_analysis', {})
-        if enhanced.get('impact_analysis', {}).get('impact_score', 0) < 40:
+        if _lookup(enhanced, 'impact_analysis', 'impact_score') < 40:
             weaknesses.append("Limited demonstration of impact")
         
-        if not sections.get('formatting', {}).get('sections', {}).get('summary', False):
+        if not _lookup(formatting, 'sections', 'summary', False):
             weaknesses.append("Missing professional summary")
         
         return weaknesses if weaknesses else ["No critical issues identified"]
@@ -357,77 +517,60 @@ class ReportGenerator:
     def _get_priority_actions(self, analysis_results: Dict[str, Any]) -> List[str]:
         """Get priority actions based on analysis"""
         actions = []
+        sections = analysis_results.get('sections') or _EMPTY
+        keywords = sections.get('keywords') or _EMPTY
+        formatting = sections.get('formatting') or _EMPTY
+        ats_issues = _lookup(sections, 'ats_compatibility', 'issues', None)
+        enhanced = analysis_results.get('enhanced_analysis') or _EMPTY
         
         # High-impact, low-effort improvements
-        sections = analysis_results.get('sections', {})
-        
-        if sections.get('quantification', {}).get('quantification_rate', 0) < 60:
+        if _lookup(sections, 'quantification', 'quantification_rate') < 60:
             actions.append("Add specific numbers and percentages to 5+ bullet points")
         
-        if not sections.get('formatting', {}).get('sections', {}).get('summary', False):
+        if not _lookup(formatting, 'sections', 'summary', False):
             actions.append("Add a 3-4 line professional summary at the top")
         
-        if sections.get('keywords', {}).get('technical_skills', {}).get('count', 0) < 6:
+        if _lookup(keywords, 'technical_skills', 'count') < 6:
             actions.append("Include more relevant technical skills and keywords")
         
-        if sections.get('ats_compatibility', {}).get('issues'):
-            actions.append(f"Fix ATS issues: {sections['ats_compatibility']['issues'][0]}")
+        if ats_issues:
+            actions.append(f"Fix ATS issues: {ats_issues[0]}")
         
-        enhanced = analysis_results.get('enhanced_analysis', {})
-        if enhanced.get('verb_hierarchy', {}).get('tier1_count', 0) < 2:
+        if _lookup(enhanced, 'verb_hierarchy', 'tier1_count') < 2:
             actions.append("Replace weak verbs with powerful action verbs (architected, orchestrated, etc.)")
         
         return actions
     
-    def _estimate_impact(self, recommendation: str) -> int:
-        """Estimate impact of recommendation (1-10 scale)"""
-        high_impact_keywords = ['quantif', 'action verb', 'ats', 'keyword', 'achievement']
-        medium_impact_keywords = ['format', 'section', 'bullet', 'professional']
-        
-        rec_lower = recommendation.lower()
-        
-        if any(keyword in rec_lower for keyword in high_impact_keywords):
-            return 8
-        elif any(keyword in rec_lower for keyword in medium_impact_keywords):
-            return 6
+    # Recommendation text comes from a fixed set of templates, so scores are memoized
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _score_recommendation(recommendation: str) -> Tuple[int, int, str]:
+        """Estimate impact (1-10), effort (1-10) and category of a recommendation in one pass"""
+        hits = _matched_keywords(recommendation.lower())
+        
+        if not hits.isdisjoint(HIGH_IMPACT_KEYWORDS):
+            impact = 8
+        elif not hits.isdisjoint(MEDIUM_IMPACT_KEYWORDS):
+            impact = 6
         else:
-            return 4
-    
-    def _estimate_effort(self, recommendation: str) -> int:
-        """Estimate effort required (1-10 scale)"""
-        low_effort_keywords = ['add', 'include', 'fix', 'remove']
-        high_effort_keywords = ['rewrite', 'restructure', 'complete', 'overhaul']
+            impact = 4
         
-        rec_lower = recommendation.lower()
-        
-        if any(keyword in rec_lower for keyword in high_effort_keywords):
-            return 8
-        elif any(keyword in rec_lower for keyword in low_effort_keywords):
-            return 3
+        if not hits.isdisjoint(HIGH_EFFORT_KEYWORDS):
+            effort = 8
+        elif not hits.isdisjoint(LOW_EFFORT_KEYWORDS):
+            effort = 3
         else:
-            return 5
-    
-    def _categorize_recommendation(self, recommendation: str) -> str:
-        """Categorize recommendation by type"""
-        categories = {
-            'content': ['quantif', 'achievement', 'bullet', 'verb'],
-            'formatting': ['format', 'section', 'ats'],
-            'keywords': ['keyword', 'skill', 'technical'],
-            'structure': ['section', 'summary', 'experience']
-        }
+            effort = 5
         
-        rec_lower = recommendation.lower()
+        category = next((category for category, keywords in RECOMMENDATION_CATEGORIES
+                         if not hits.isdisjoint(keywords)), 'general')
         
-        for category, keywords in categories.items():
-            if any(keyword in rec_lower for keyword in keywords):
-                return category
-        
-        return 'general'
+        return impact, effort, category
     
     def _calculate_readability_score(self, sections: Dict[str, Any]) -> int:
         """Calculate readability score"""
-        content_quality = sections.get('content_quality', {})
-        formatting = sections.get('formatting', {})
+        content_quality = sections.get('content_quality') or _EMPTY
+        formatting = sections.get('formatting') or _EMPTY
         
         score = 0
         score += min(formatting.get('bullet_score', 0), 40)  # Max 40 points for bullets
@@ -438,17 +581,17 @@ class ReportGenerator:
     
     def _calculate_keyword_density(self, sections: Dict[str, Any]) -> int:
         """Calculate keyword optimization score"""
-        keywords = sections.get('keywords', {})
+        keywords = sections.get('keywords') or _EMPTY
         
-        tech_score = min(keywords.get('technical_skills', {}).get('count', 0) * 5, 40)
-        power_verb_score = min(keywords.get('power_verbs', {}).get('count', 0) * 8, 40)
-        job_match_score = min(keywords.get('job_match', {}).get('score', 0) * 0.2, 20)
+        tech_score = min(_lookup(keywords, 'technical_skills', 'count') * 5, 40)
+        power_verb_score = min(_lookup(keywords, 'power_verbs', 'count') * 8, 40)
+        job_match_score = min(_lookup(keywords, 'job_match', 'score') * 0.2, 20)
         
         return min(int(tech_score + power_verb_score + job_match_score), 100)
     
     def _calculate_impact_score(self, sections: Dict[str, Any], enhanced: Dict[str, Any]) -> int:
         """Calculate impact demonstration score"""
-        quantification_score = sections.get('quantification', {}).get('score', 0) * 0.4
+        quantification_score = _lookup(sections, 'quantification', 'score') * 0.4
         
         if enhanced.get('impact_analysis'):
             impact_score = enhanced['impact_analysis'].get('impact_score', 0) * 0.6
@@ -459,7 +602,7 @@ class ReportGenerator:
     
     def _calculate_professional_score(self, sections: Dict[str, Any], enhanced: Dict[str, Any]) -> int:
         """Calculate professional presentation score"""
-        ats_score = sections.get('ats_compatibility', {}).get('score', 0) * 0.5
+        ats_score = _lookup(sections, 'ats_compatibility', 'score') * 0.5
         
         if enhanced.get('professional_presentation'):
             presentation_score = enhanced['professional_presentation'].get('presentation_score', 0) * 0.5
@@ -471,16 +614,8 @@ class ReportGenerator:
     def _create_benchmark_comparison(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create benchmark comparison"""
         overall_score = analysis_results.get('enhanced_score', analysis_results.get('overall_score', 0))
-        
-        benchmarks = {
-            'industry_average': 65,
-            'top_10_percent': 85,
-            'ats_passing_threshold': 70,
-            'interview_likely_threshold': 80
-        }
-        
         comparison = {}
-        for benchmark_name, threshold in benchmarks.items():
+        for benchmark_name, threshold in BENCHMARKS:
             comparison[benchmark_name] = {
                 'threshold': threshold,
                 'current_score': overall_score,
@@ -495,18 +630,18 @@ class ReportGenerator:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save JSON report
-            json_path = output_path.with_suffix('.json')
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
-            
-            # Save text summary
-            txt_path = output_path.with_suffix('.txt')
-            self._save_text_summary(report, txt_path)
+            # Serialize up front so each writer below only does file I/O
+            json_bytes = json_dumps(report)
             
-            # Save CSV metrics
-            csv_path = output_path.with_suffix('.csv')
-            self._save_csv_metrics(report, csv_path)
+            # Write the JSON report, text summary and CSV metrics concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(output_path.with_suffix('.json').write_bytes, json_bytes),
+                    executor.submit(self._save_text_summary, report, output_path.with_suffix('.txt')),
+                    executor.submit(self._save_csv_metrics, report, output_path.with_suffix('.csv'))
+                ]
+            for future in futures:
+                future.result()  # Re-raise the first write failure
             
             logger.info(f"Report saved in multiple formats: {output_path.stem}")
             return True
@@ -517,32 +652,31 @@ class ReportGenerator:
     
     def _save_text_summary(self, report: Dict[str, Any], output_path: Path) -> None:
         """Save human-readable text summary"""
+        parts = ["CV ANALYSIS REPORT\n", "=" * 50 + "\n\n"]
+        
+        # Executive Summary
+        exec_summary = report.get('executive_summary', {})
+        assessment = exec_summary.get('overall_assessment', {})
+        parts.append(f"OVERALL SCORE: {assessment.get('score', 0)}/100 (Grade: {assessment.get('grade', 'N/A')})\n")
+        parts.append(f"ASSESSMENT: {assessment.get('assessment', 'N/A')}\n\n")
+        
+        # Strengths
+        parts.append("KEY STRENGTHS:\n")
+        parts.extend(f"• {strength}\n" for strength in exec_summary.get('key_strengths', []))
+        parts.append("\n")
+        
+        # Weaknesses
+        parts.append("AREAS FOR IMPROVEMENT:\n")
+        parts.extend(f"• {weakness}\n" for weakness in exec_summary.get('critical_weaknesses', []))
+        parts.append("\n")
+        
+        # Priority Actions
+        parts.append("PRIORITY ACTIONS:\n")
+        parts.extend(f"• {action}\n" for action in exec_summary.get('priority_actions', []))
+        
+        # One write of the assembled text
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("CV ANALYSIS REPORT\n")
-            f.write("=" * 50 + "\n\n")
-            
-            # Executive Summary
-            exec_summary = report.get('executive_summary', {})
-            assessment = exec_summary.get('overall_assessment', {})
-            f.write(f"OVERALL SCORE: {assessment.get('score', 0)}/100 (Grade: {assessment.get('grade', 'N/A')})\n")
-            f.write(f"ASSESSMENT: {assessment.get('assessment', 'N/A')}\n\n")
-            
-            # Strengths
-            f.write("KEY STRENGTHS:\n")
-            for strength in exec_summary.get('key_strengths', []):
-                f.write(f"• {strength}\n")
-            f.write("\n")
-            
-            # Weaknesses
-            f.write("AREAS FOR IMPROVEMENT:\n")
-            for weakness in exec_summary.get('critical_weaknesses', []):
-                f.write(f"• {weakness}\n")
-            f.write("\n")
-            
-            # Priority Actions
-            f.write("PRIORITY ACTIONS:\n")
-            for action in exec_summary.get('priority_actions', []):
-                f.write(f"• {action}\n")
+            f.write(''.join(parts))
     
     def _save_csv_metrics(self, report: Dict[str, Any], output_path: Path) -> None:
         """Save metrics in CSV format"""
@@ -559,6 +693,9 @@ class ReportGenerator:
             if isinstance(score, (int, float)):
                 metrics_data.append([metric_name.replace('_', ' ').title(), score, '0-100', 'Score'])
         
-        # Create DataFrame and save
-        df = pd.DataFrame(metrics_data, columns=['Metric', 'Score', 'Scale', 'Type'])
-        df.to_csv(output_path, index=False)
+        # A handful of rows: format them in memory (csv handles quoting) and write the bytes once
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(['Metric', 'Score', 'Scale', 'Type'])
+        writer.writerows(metrics_data)
+        output_path.write_bytes(buffer.getvalue().encode('utf-8'))
@@ -1,43 +1,191 @@
 """ATS Scanner Module - Comprehensive CV Analysis"""
 
-import pandas as pd
+import csv
+import hashlib
+import io
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 import re
+from .fuzzy import bounded_levenshtein
+from .utils import json_dumps
+
+try:
+    import ahocorasick
+except ImportError:  # fall back to one substring test per keyword
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Below this many non-blank characters there is nothing worth analyzing
+MIN_CV_TEXT_LENGTH = 32
+
+# Job-specific terms picked out of a job description, as whole words
+JD_TECH_TERMS = ('python', 'java', 'docker', 'aws', 'kubernetes')
+# Longest alternative first so SRE prefers the longest term at each position
+_JD_TECH_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(JD_TECH_TERMS, key=len, reverse=True))) + r')\b'
+)
+
+# Keywords scored by the base scan, in the order found skills are reported
+ATS_KEYWORDS = MappingProxyType({
+    'power_verbs': (
+        'achieved', 'analyzed', 'architected', 'automated', 'built', 'collaborated',
+        'created', 'delivered', 'designed', 'developed', 'enhanced', 'executed',
+        'implemented', 'improved', 'increased', 'led', 'managed', 'optimized',
+        'orchestrated', 'produced', 'reduced', 'resolved', 'spearheaded', 'streamlined'
+    ),
+    'technical_skills': (
+        'python', 'java', 'javascript', 'docker', 'kubernetes', 'aws', 'azure',
+        'devops', 'ci/cd', 'jenkins', 'git', 'linux', 'sql', 'nosql', 'mongodb',
+        'postgresql', 'redis', 'elasticsearch', 'kafka', 'microservices', 'api',
+        'rest', 'graphql', 'terraform', 'ansible', 'prometheus', 'grafana'
+    ),
+    'soft_skills': (
+        'leadership', 'communication', 'teamwork', 'problem-solving', 'analytical',
+        'critical thinking', 'adaptability', 'mentoring', 'collaboration',
+        'project management', 'stakeholder management', 'cross-functional'
+    )
+})
+
+# Technical and soft skills every job description is matched against
+SKILL_KEYWORDS = frozenset(ATS_KEYWORDS['technical_skills'] + ATS_KEYWORDS['soft_skills'])
+
+# CV sections the formatting check looks for, in report order; matched against the lowercased CV
+_SECTION_RES = {
+    'contact': re.compile(r'(email|phone|linkedin)'),
+    'summary': re.compile(r'(summary|profile|objective)'),
+    'experience': re.compile(r'(experience|work|employment)'),
+    'education': re.compile(r'education'),
+    'skills': re.compile(r'skills')
+}
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_QUANTIFIED_RE = re.compile(r'\d+[%$]?|\$\d+')
+_QUANTIFIED_BULLET_RE = re.compile(r'\d+[%$]?|\$\d+|\d+\+|\d+x|\d+ years?', re.I)
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s\-.,!?()%$]')
+# Deletes every ASCII character _SPECIAL_CHAR_RE does not match, leaving only the special ones
+_DROP_ASCII_ALLOWED = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not _SPECIAL_CHAR_RE.match(c)
+))
+_EMAIL_RE = re.compile(r'[\w.-]+@[\w.-]+\.\w+')
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}')
+
+def _count_special_chars(text: str) -> int:
+    """Characters outside word characters, whitespace and basic punctuation"""
+    if text.isascii():
+        # str.translate has a C fast path for ASCII that beats building a list of regex matches
+        return len(text.translate(_DROP_ASCII_ALLOWED))
+    return len(_SPECIAL_CHAR_RE.findall(text))
+
+CV_CACHE_SIZE = 32
+
+# Parsed text keyed on (suffix, digest of the file bytes), so a copied or re-saved but unchanged CV isn't parsed again
+_parsed_by_content: "OrderedDict[Tuple[str, bytes], str]" = OrderedDict()
+_parsed_lock = threading.Lock()
+
+def _parse_cv_bytes(suffix: str, data: bytes) -> str:
+    """Text of a .docx or plain-text CV from its raw bytes"""
+    if suffix == '.docx':
+        from docx import Document
+        doc = Document(io.BytesIO(data))
+        return '\n'.join(paragraph.text for paragraph in doc.paragraphs)
+    # Same result as a text-mode open(): UTF-8 with universal newlines
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+@lru_cache(maxsize=CV_CACHE_SIZE)
+def _read_cv_text(path: str, mtime_ns: int, size: int) -> str:
+    """Parse a CV file; keyed on mtime and size so an edited file is read again"""
+    cv_path = Path(path)
+    suffix = cv_path.suffix.lower()
+    if suffix == '.pdf':
+        # PDF extraction would go here
+        logger.warning("PDF extraction not yet implemented")
+        return ""
+    
+    data = cv_path.read_bytes()
+    key = (suffix, hashlib.blake2b(data, digest_size=16).digest())
+    with _parsed_lock:
+        text = _parsed_by_content.get(key)
+        if text is not None:
+            _parsed_by_content.move_to_end(key)
+            return text
+    
+    text = _parse_cv_bytes(suffix, data)
+    with _parsed_lock:
+        _parsed_by_content[key] = text
+        if len(_parsed_by_content) > CV_CACHE_SIZE:
+            _parsed_by_content.popitem(last=False)
+    return text
+
+# Scanner owned by a scan_many worker process, built once by its initializer
+_worker_scanner = None
+
+def _init_scan_worker(scanner_class: type):
+    global _worker_scanner
+    _worker_scanner = scanner_class()
+
+def _scan_in_worker(job: Tuple[Path, str]) -> Dict[str, Any]:
+    return _worker_scanner.scan_cv(*job)
+
 class ATSScanner:
     """Main scanner for ATS compatibility analysis"""
     
-    def __init__(self):
-        self.ats_keywords = {
-            'power_verbs': [
-                'achieved', 'analyzed', 'architected', 'automated', 'built', 'collaborated',
-                'created', 'delivered', 'designed', 'developed', 'enhanced', 'executed',
-                'implemented', 'improved', 'increased', 'led', 'managed', 'optimized',
-                'orchestrated', 'produced', 'reduced', 'resolved', 'spearheaded', 'streamlined'
-            ],
-            'technical_skills': [
-                'python', 'java', 'javascript', 'docker', 'kubernetes', 'aws', 'azure',
-                'devops', 'ci/cd', 'jenkins', 'git', 'linux', 'sql', 'nosql', 'mongodb',
-                'postgresql', 'redis', 'elasticsearch', 'kafka', 'microservices', 'api',
-                'rest', 'graphql', 'terraform', 'ansible', 'prometheus', 'grafana'
-            ],
-            'soft_skills': [
-                'leadership', 'communication', 'teamwork', 'problem-solving', 'analytical',
-                'critical thinking', 'adaptability', 'mentoring', 'collaboration',
-                'project management', 'stakeholder management', 'cross-functional'
-            ]
-        }
-        
+    # Shared by every instance; the automaton is built from it on first use
+    ats_keywords = ATS_KEYWORDS
+    
+    @classmethod
+    def _get_keyword_automaton(cls):
+        """This class's keyword automaton, built once per class; None without pyahocorasick"""
+        if '_keyword_automaton' not in cls.__dict__:
+            cls._keyword_automaton = cls._build_keyword_automaton()
+        return cls._keyword_automaton
+    
+    @classmethod
+    def _build_keyword_automaton(cls):
+        """One Aho-Corasick automaton over every ATS keyword, if pyahocorasick is installed"""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for category, keywords in cls.ats_keywords.items():
+            for keyword in keywords:
+                automaton.add_word(keyword, (category, keyword))
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_keywords(self, cv_lower: str) -> Dict[str, set]:
+        """Keywords of each category occurring anywhere in ``cv_lower``, found in a single pass when possible"""
+        hits = {category: set() for category in self.ats_keywords}
+        automaton = self._get_keyword_automaton()
+        if automaton is not None:
+            for _, (category, keyword) in automaton.iter(cv_lower):
+                hits[category].add(keyword)
+        else:
+            # Plain str containment: CPython runs the same search on 1- and 2-byte strings as on
+            # bytes, so probing an encoded copy measured no faster and would add an encode per scan
+            for category, keywords in self.ats_keywords.items():
+                hits[category].update(keyword for keyword in keywords if keyword in cv_lower)
+        return hits
+    
+    def _fuzzy_match(self, keyword: str, token: str, max_distance: Optional[int] = None) -> bool:
+        """Whether ``token`` is a near-miss spelling of ``keyword``, allowing about one edit per six characters"""
+        if max_distance is None:
+            max_distance = max(1, len(keyword) // 6)
+        return bounded_levenshtein(keyword, token, max_distance) <= max_distance
+    
     def scan_cv(self, cv_path: Path, job_description: str = "") -> Dict[str, Any]:
         """Perform comprehensive ATS scan of CV"""
         try:
             # Extract text from CV
             cv_text = self._extract_text(cv_path)
+            if len(cv_text.strip()) < MIN_CV_TEXT_LENGTH:
+                return self._empty_result(cv_path, reason='no_text')
+            stats = self._text_stats(cv_text)
             
             # Perform analysis
             results = {
@@ -45,11 +193,11 @@ class ATSScanner:
                 'cv_path': str(cv_path),
                 'overall_score': 0,
                 'sections': {
-                    'keywords': self._analyze_keywords(cv_text, job_description),
-                    'formatting': self._analyze_formatting(cv_text),
-                    'content_quality': self._analyze_content_quality(cv_text),
-                    'ats_compatibility': self._analyze_ats_compatibility(cv_text),
-                    'quantification': self._analyze_quantification(cv_text)
+                    'keywords': self._analyze_keywords(stats, job_description),
+                    'formatting': self._analyze_formatting(stats),
+                    'content_quality': self._analyze_content_quality(stats),
+                    'ats_compatibility': self._analyze_ats_compatibility(stats),
+                    'quantification': self._analyze_quantification(stats)
                 },
                 'recommendations': []
             }
@@ -66,40 +214,107 @@ class ATSScanner:
             logger.error(f"Error scanning CV: {e}")
             return {'error': str(e)}
     
+    @staticmethod
+    def _empty_result(cv_path: Path, reason: str) -> Dict[str, Any]:
+        """A zero-score result in the usual shape, for a CV with too little text to analyze"""
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'cv_path': str(cv_path),
+            'overall_score': 0,
+            'reason': reason,
+            'sections': {
+                'keywords': {
+                    'power_verbs': {'count': 0, 'score': 0},
+                    'technical_skills': {'found': [], 'count': 0, 'score': 0},
+                    'soft_skills': {'found': [], 'count': 0, 'score': 0},
+                    'job_match': {'score': 0, 'matched_count': 0}
+                },
+                'formatting': {
+                    'sections': {name: False for name in _SECTION_RES},
+                    'section_score': 0.0,
+                    'bullet_points': 0,
+                    'bullet_score': 0,
+                    'overall_formatting_score': 0.0
+                },
+                'content_quality': {
+                    'word_count': 0,
+                    'sentence_count': 0,
+                    'avg_words_per_sentence': 0.0,
+                    'bullet_points': 0,
+                    'quantified_achievements': 0,
+                    'quality_score': 0
+                },
+                'ats_compatibility': {
+                    'score': 0,
+                    'issues': ['No extractable text'],
+                    'contact_info': {'email_found': False, 'phone_found': False}
+                },
+                'quantification': {
+                    'total_bullets': 0,
+                    'quantified_bullets': 0,
+                    'quantification_rate': 0.0,
+                    'quantified_examples': [],
+                    'score': 0.0
+                }
+            },
+            'recommendations': ["No extractable text found - save the CV as .docx or plain text and scan it again"]
+        }
+    
+    def scan_many(self, cv_paths: List[Path], job_description: str = "",
+                  max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Scan several CVs in parallel worker processes; results come back in input order"""
+        jobs = [(cv_path, job_description) for cv_path in cv_paths]
+        if len(jobs) < 2:
+            return [self.scan_cv(*job) for job in jobs]
+        
+        # Each worker builds its own scanner (and keyword automaton) once, not once per CV
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_scan_worker,
+                                 initargs=(type(self),)) as executor:
+            return list(executor.map(_scan_in_worker, jobs, chunksize=4))
+    
     def _extract_text(self, cv_path: Path) -> str:
         """Extract text from CV file"""
         try:
-            if cv_path.suffix.lower() == '.docx':
-                from docx import Document
-                doc = Document(cv_path)
-                return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-            elif cv_path.suffix.lower() == '.pdf':
-                # PDF extraction would go here
-                logger.warning("PDF extraction not yet implemented")
-                return ""
-            else:
-                with open(cv_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+            # Failures raise out of the cached reader, so they are never cached
+            stat = Path(cv_path).stat()
+            return _read_cv_text(str(cv_path), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             logger.error(f"Error extracting text from {cv_path}: {e}")
             return ""
     
-    def _analyze_keywords(self, cv_text: str, job_description: str) -> Dict[str, Any]:
+    def _text_stats(self, cv_text: str) -> Dict[str, Any]:
+        """Line-level facts about the CV, gathered in one walk and shared by the analyzers"""
+        lines = cv_text.splitlines()
+        bullet_lines = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith(('•', '-', '*')):
+                bullet_lines.append(stripped)
+        
+        return {
+            'text': cv_text,
+            'lower': cv_text.lower(),
+            'lines': lines,
+            'bullet_lines': bullet_lines,
+            'word_count': len(cv_text.split()),
+            'special_char_count': _count_special_chars(cv_text)
+        }
+    
+    def _analyze_keywords(self, stats: Dict[str, Any], job_description: str) -> Dict[str, Any]:
         """Analyze keyword presence and density"""
-        cv_lower = cv_text.lower()
-        jd_lower = job_description.lower()
+        cv_lower = stats['lower']
+        hits = self._find_keywords(cv_lower)
         
         # Count power verbs
-        power_verb_count = sum(1 for verb in self.ats_keywords['power_verbs'] 
-                              if verb in cv_lower)
+        power_verb_count = len(hits['power_verbs'])
         
-        # Count technical skills
+        # Count technical skills (listed in keyword order)
         tech_skills_found = [skill for skill in self.ats_keywords['technical_skills'] 
-                           if skill in cv_lower]
+                           if skill in hits['technical_skills']]
         
         # Count soft skills
         soft_skills_found = [skill for skill in self.ats_keywords['soft_skills'] 
-                           if skill in cv_lower]
+                           if skill in hits['soft_skills']]
         
         # Job description matching (if provided)
         jd_match_score = 0
@@ -129,24 +344,18 @@ class ATSScanner:
             }
         }
     
-    def _analyze_formatting(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_formatting(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze CV formatting for ATS compatibility"""
-        lines = cv_text.split('\n')
+        cv_lower = stats['lower']
         
         # Check for common sections
-        sections_found = {
-            'contact': bool(re.search(r'(email|phone|linkedin)', cv_text, re.I)),
-            'summary': bool(re.search(r'(summary|profile|objective)', cv_text, re.I)),
-            'experience': bool(re.search(r'(experience|work|employment)', cv_text, re.I)),
-            'education': bool(re.search(r'education', cv_text, re.I)),
-            'skills': bool(re.search(r'skills', cv_text, re.I))
-        }
+        sections_found = {name: bool(pattern.search(cv_lower)) for name, pattern in _SECTION_RES.items()}
         
         # Calculate formatting score
         section_score = sum(sections_found.values()) / len(sections_found) * 100
         
         # Check for bullet points
-        bullet_count = sum(1 for line in lines if line.strip().startswith(('•', '-', '*')))
+        bullet_count = len(stats['bullet_lines'])
         bullet_score = min(bullet_count * 5, 100)
         
         return {
@@ -157,19 +366,19 @@ class ATSScanner:
             'overall_formatting_score': (section_score + bullet_score) / 2
         }
     
-    def _analyze_content_quality(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_content_quality(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze content quality metrics"""
-        words = cv_text.split()
-        sentences = re.split(r'[.!?]+', cv_text)
+        cv_text = stats['text']
+        sentences = _SENTENCE_SPLIT_RE.split(cv_text)
         
         # Basic metrics
-        word_count = len(words)
+        word_count = stats['word_count']
         sentence_count = len([s for s in sentences if s.strip()])
         avg_words_per_sentence = word_count / max(sentence_count, 1)
         
         # Quality indicators
-        bullet_points = len(re.findall(r'^\s*[•\-\*]', cv_text, re.MULTILINE))
-        quantified_achievements = len(re.findall(r'\d+[%$]?|\$\d+', cv_text))
+        bullet_points = len(stats['bullet_lines'])
+        quantified_achievements = len(_QUANTIFIED_RE.findall(cv_text))
         
         return {
             'word_count': word_count,
@@ -180,8 +389,9 @@ class ATSScanner:
             'quality_score': min((bullet_points * 5) + (quantified_achievements * 10), 100)
         }
     
-    def _analyze_ats_compatibility(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_ats_compatibility(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze ATS compatibility factors"""
+        cv_text = stats['text']
         compatibility_issues = []
         score = 100
         
@@ -191,14 +401,13 @@ class ATSScanner:
             score -= 10
         
         # Check for excessive special characters
-        special_char_count = len(re.findall(r'[^\w\s\-.,!?()%$]', cv_text))
-        if special_char_count > 50:
+        if stats['special_char_count'] > 50:
             compatibility_issues.append('Excessive special characters')
             score -= 15
         
         # Check for proper contact info formatting
-        email_found = bool(re.search(r'[\w.-]+@[\w.-]+\.\w+', cv_text))
-        phone_found = bool(re.search(r'\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}', cv_text))
+        email_found = bool(_EMAIL_RE.search(cv_text))
+        phone_found = bool(_PHONE_RE.search(cv_text))
         
         if not email_found:
             compatibility_issues.append('No email address found')
@@ -217,16 +426,12 @@ class ATSScanner:
             }
         }
     
-    def _analyze_quantification(self, cv_text: str) -> Dict[str, Any]:
+    def _analyze_quantification(self, stats: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze quantification in achievements"""
-        # Find all bullet points
-        bullet_lines = re.findall(r'^\s*[•\-\*].*$', cv_text, re.MULTILINE)
+        bullet_lines = stats['bullet_lines']
         
         # Count quantified bullets
-        quantified_bullets = []
-        for bullet in bullet_lines:
-            if re.search(r'\d+[%$]?|\$\d+|\d+\+|\d+x|\d+ years?', bullet, re.I):
-                quantified_bullets.append(bullet.strip())
+        quantified_bullets = [bullet for bullet in bullet_lines if _QUANTIFIED_BULLET_RE.search(bullet)]
         
         total_bullets = len(bullet_lines)
         quantified_count = len(quantified_bullets)
@@ -245,41 +450,25 @@ class ATSScanner:
         # Simple keyword extraction - could be enhanced with NLP
         jd_lower = job_description.lower()
         
-        # Common technical terms and skills
-        all_keywords = (self.ats_keywords['technical_skills'] + 
-                       self.ats_keywords['soft_skills'])
-        
-        # Add job-specific terms
-        job_terms = re.findall(r'\b[a-z]{3,}\b', jd_lower)
-        technical_terms = [term for term in job_terms 
-                          if term in ['python', 'java', 'docker', 'aws', 'kubernetes']]
-        
-        return list(set(all_keywords + technical_terms))
+        # Common technical terms and skills, plus job-specific terms
+        return list(SKILL_KEYWORDS.union(_JD_TECH_RE.findall(jd_lower)))
     
     def _calculate_overall_score(self, sections: Dict[str, Any]) -> int:
         """Calculate overall ATS score"""
-        scores = []
-        
-        # Keyword analysis (30%)
-        keyword_score = (sections['keywords']['power_verbs']['score'] * 0.3 +
-                        sections['keywords']['technical_skills']['score'] * 0.4 +
-                        sections['keywords']['soft_skills']['score'] * 0.2 +
-                        sections['keywords']['job_match']['score'] * 0.1)
-        scores.append(keyword_score * 0.3)
-        
-        # Formatting (25%)
-        scores.append(sections['formatting']['overall_formatting_score'] * 0.25)
-        
-        # Content quality (20%)
-        scores.append(sections['content_quality']['quality_score'] * 0.2)
-        
-        # ATS compatibility (15%)
-        scores.append(sections['ats_compatibility']['score'] * 0.15)
-        
-        # Quantification (10%)
-        scores.append(sections['quantification']['score'] * 0.1)
-        
-        return int(sum(scores))
+        keywords = sections['keywords']
+        
+        # Keyword analysis weighted within itself, then 30% of the total
+        keyword_score = (keywords['power_verbs']['score'] * 0.3 +
+                        keywords['technical_skills']['score'] * 0.4 +
+                        keywords['soft_skills']['score'] * 0.2 +
+                        keywords['job_match']['score'] * 0.1)
+        
+        # Formatting 25%, content quality 20%, ATS compatibility 15%, quantification 10%
+        return int(keyword_score * 0.3 +
+                   sections['formatting']['overall_formatting_score'] * 0.25 +
+                   sections['content_quality']['quality_score'] * 0.2 +
+                   sections['ats_compatibility']['score'] * 0.15 +
+                   sections['quantification']['score'] * 0.1)
     
     def _generate_recommendations(self, sections: Dict[str, Any]) -> List[str]:
         """Generate improvement recommendations"""
@@ -317,33 +506,28 @@ class ATSScanner:
         """Save scan results to file"""
         try:
             # Save detailed results as JSON
-            import json
             json_path = output_path.with_suffix('.json')
-            with open(json_path, 'w') as f:
-                json.dump(results, f, indent=2)
+            json_path.write_bytes(json_dumps(results))
             
-            # Save summary as CSV
+            # Save summary as CSV (scores as floats, matching the layout the summary has always had)
             csv_path = output_path.with_suffix('.csv')
-            summary_data = {
-                'Metric': [],
-                'Score': [],
-                'Details': []
-            }
             
             # Add overall score
-            summary_data['Metric'].append('Overall ATS Score')
-            summary_data['Score'].append(results['overall_score'])
-            summary_data['Details'].append(f"{results['overall_score']}/100")
+            summary_rows = [['Overall ATS Score', float(results['overall_score']), f"{results['overall_score']}/100"]]
             
             # Add section scores
             for section_name, section_data in results['sections'].items():
                 if isinstance(section_data, dict) and 'score' in section_data:
-                    summary_data['Metric'].append(section_name.replace('_', ' ').title())
-                    summary_data['Score'].append(section_data['score'])
-                    summary_data['Details'].append(f"{section_data['score']}/100")
+                    summary_rows.append([
+                        section_name.replace('_', ' ').title(),
+                        float(section_data['score']),
+                        f"{section_data['score']}/100"
+                    ])
             
-            df = pd.DataFrame(summary_data)
-            df.to_csv(csv_path, index=False)
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(['Metric', 'Score', 'Details'])
+                writer.writerows(summary_rows)
             
             logger.info(f"Results saved to {json_path} and {csv_path}")
             return True
@@ -1,16 +1,23 @@
+import json
 import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback; same results, slower
+    orjson = None
+
 def setup_logger(log_file: str, level: str = "INFO", rotate_mb: int = 5):
-    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     logger = logging.getLogger("ats_app")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    # Already configured: don't open (and leak) another rotating file handle
+    if logger.handlers:
+        return logger
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
     handler = RotatingFileHandler(log_file, maxBytes=rotate_mb*1024*1024, backupCount=3, encoding="utf-8")
-    fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
-    handler.setFormatter(fmt)
-    if not logger.handlers:
-        logger.addHandler(handler)
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+    logger.addHandler(handler)
     return logger
 
 def read_docx_text(path):
@@ -28,4 +35,17 @@ def read_text_flexible(path):
     if p.suffix.lower() == ".docx":
         return read_docx_text(p)
     # For PDFs: advise converting to .txt for accuracy
-    return p.read_text(encoding="utf-8", errors="ignore")
\ No newline at end of file
+    return p.read_text(encoding="utf-8", errors="ignore")
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")